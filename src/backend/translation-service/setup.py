@@ -43,6 +43,10 @@ setup(
         "prometheus-client==0.17.0",
         "python-json-logger==2.0.7",
         "pika==1.3.2",
+        "orjson==3.9.10",
+        "blake3==0.4.1",
+        "uvloop==0.19.0; sys_platform != 'win32'",
+        "httptools==0.6.1",
         "python-multipart==0.0.6",
         "httpx==0.25.0",
         "cryptography==41.0.4",
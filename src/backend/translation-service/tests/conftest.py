@@ -11,8 +11,10 @@ Version: 1.0.0
 import pytest  # version: 7.4.3
 import pytest_asyncio  # version: 0.21.1
 from unittest.mock import AsyncMock, MagicMock, patch  # version: python3.11+
+import asyncio
 import json
 import os
+import sys
 from pathlib import Path
 from typing import Dict, Any, Optional, AsyncGenerator
 
@@ -84,6 +86,23 @@ def pytest_configure(config):
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
+@pytest.fixture(scope="session", autouse=True)
+def event_loop_policy():
+    """
+    Session fixture installing the uvloop event loop policy for async tests.
+
+    Falls back to the default asyncio policy on Windows, where uvloop is unavailable.
+    """
+    if sys.platform != 'win32':
+        import uvloop  # version: 0.19.0
+        policy = uvloop.EventLoopPolicy()
+    else:
+        policy = asyncio.DefaultEventLoopPolicy()
+
+    asyncio.set_event_loop_policy(policy)
+    yield policy
+    asyncio.set_event_loop_policy(None)
+
 @pytest.fixture
 def mock_genai_config():
     """
@@ -12,6 +12,7 @@ from unittest.mock import Mock, patch  # version: python3.11+
 
 from ...translation_service.formats.crowdstrike import (
     CrowdstrikeFormat,
+    _extract_sections,
     validate_crowdstrike_syntax
 )
 
@@ -56,6 +57,7 @@ condition: EventType IN ("ProcessRollup2", "ProcessCreate") AND
           (FileName MATCHES "*.exe" OR CommandLine CONTAINS_ANY ("bypass", "exploit"))
 '''
 
+
 @pytest.mark.unit
 def test_crowdstrike_format_initialization(mock_translation_model):
     """Test initialization of CrowdstrikeFormat class with validation."""
@@ -83,6 +85,7 @@ def test_crowdstrike_format_initialization(mock_translation_model):
     except Exception as e:
         pytest.fail(f"Format handler initialization failed: {str(e)}")
 
+
 @pytest.mark.unit
 def test_parse_valid_crowdstrike_detection(mock_translation_model):
     """Test parsing of valid Crowdstrike detection rules."""
@@ -114,6 +117,7 @@ def test_parse_valid_crowdstrike_detection(mock_translation_model):
     assert 'process_name' in complex_result['detection']['fields']
     assert 'parent_process' in complex_result['detection']['fields']
 
+
 @pytest.mark.unit
 def test_generate_crowdstrike_detection(mock_translation_model):
     """Test generation of Crowdstrike detection rules."""
@@ -158,6 +162,19 @@ def test_generate_crowdstrike_detection(mock_translation_model):
     with pytest.raises(ValueError):
         handler.generate({'invalid': 'data'})
 
+    # Missing title or condition is rejected before rendering
+    with pytest.raises(ValueError, match="title"):
+        handler.generate({'metadata': {}, 'detection': detection_data['detection']})
+    with pytest.raises(ValueError, match="condition"):
+        handler.generate({
+            'metadata': detection_data['metadata'],
+            'detection': {'fields': detection_data['detection']['fields'], 'condition': ''}
+        })
+
+    # Strict mode also validates the generated text
+    assert handler.generate(detection_data, strict=True) == result
+
+
 @pytest.mark.unit
 def test_validate_crowdstrike_syntax():
     """Test validation of Crowdstrike detection syntax."""
@@ -185,6 +202,7 @@ def test_validate_crowdstrike_syntax():
     assert len(report['errors']) > 0
     assert 'Missing required section' in report['errors'][0]
 
+
 @pytest.mark.unit
 def test_field_name_normalization(mock_translation_model):
     """Test field name normalization capabilities."""
@@ -228,4 +246,57 @@ def test_field_name_normalization(mock_translation_model):
     }
     
     result = handler.generate(detection_with_custom)
-    assert 'CustomField' in result
\ No newline at end of file
+    assert 'CustomField' in result
+
+
+@pytest.mark.unit
+def test_validation_results_cached_per_handler(mock_translation_model):
+    """Test repeated validation of the same text reuses the cached syntax check."""
+    handler = CrowdstrikeFormat(mock_translation_model)
+
+    with patch(
+        f'{CrowdstrikeFormat.__module__}.validate_crowdstrike_syntax',
+        wraps=validate_crowdstrike_syntax
+    ) as validator:
+        first = handler.validate(SAMPLE_CROWDSTRIKE_DETECTION)
+        second = handler.validate(SAMPLE_CROWDSTRIKE_DETECTION)
+        handler.parse(SAMPLE_CROWDSTRIKE_DETECTION)
+
+    assert validator.call_count == 1
+    assert first == second
+
+    # Callers receive copies, so extending one report leaves the cache untouched
+    first['errors'].append('caller error')
+    assert 'caller error' not in handler.validate(SAMPLE_CROWDSTRIKE_DETECTION)['errors']
+
+
+@pytest.mark.unit
+def test_parse_and_validate_share_section_extraction(mock_translation_model):
+    """Test parse and validate reuse the sections located once during validation."""
+    handler = CrowdstrikeFormat(mock_translation_model)
+    module = CrowdstrikeFormat.__module__
+
+    with patch(f'{module}._extract_sections', wraps=_extract_sections) as extractor:
+        report = handler.validate(COMPLEX_CROWDSTRIKE_DETECTION)
+        parsed = handler.parse(COMPLEX_CROWDSTRIKE_DETECTION)
+
+    assert extractor.call_count == 1
+    assert report['is_valid']
+    assert parsed['metadata']['severity'] == "high"
+    assert parsed['detection']['condition'].startswith('EventType IN')
+
+
+@pytest.mark.unit
+def test_parse_event_value_on_next_line(mock_translation_model):
+    """Test an event field whose value starts on the following line is kept."""
+    handler = CrowdstrikeFormat(mock_translation_model)
+    detection = SAMPLE_CROWDSTRIKE_DETECTION.replace(
+        'CommandLine: "bypass"',
+        'CommandLine:\n        "bypass"'
+    )
+
+    report = handler.validate(detection)
+    parsed = handler.parse(detection)
+
+    assert 'CommandLine' in report['field_validation']
+    assert parsed['detection']['fields']['command_line'] == '"bypass"'
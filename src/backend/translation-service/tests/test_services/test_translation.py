@@ -12,19 +12,27 @@ This module provides extensive testing of the translation service functionality
 Version: 1.0.0
 """
 
+import asyncio  # version: 3.11+
 import pytest  # version: 7.4.3
 import pytest_asyncio  # version: 0.21.1
+import orjson  # version: 3.9.10
+import pydantic  # version: 2.4.2
+import blake3  # version: 0.4.1
+import redis.asyncio  # version: 5.0.1
 from unittest.mock import Mock, patch, AsyncMock  # version: 3.11+
 from typing import Dict, List, Any
 
+from ...translation_service.services import translation as translation_module
 from ...translation_service.services.translation import (
     TranslationService,
+    CoalescingTranslator,
     TranslationResult,
     BatchTranslationResult,
     SUPPORTED_FORMATS,
     MIN_CONFIDENCE_SCORE
 )
 from ...translation_service.services.validation import ValidationService
+from ...translation_service.genai.model import TranslationModel
 
 # Test constants
 FORMAT_COMBINATIONS = [
@@ -67,35 +75,58 @@ class TestTranslationService:
         )
         return service
 
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def mock_translation_model(self):
-        """Mock for GenAI translation model."""
-        model = AsyncMock()
-        model.translate_detection.return_value = {
-            'translated_text': 'Translated detection',
-            'confidence_score': 0.95,
-            'metadata': {'model': 'gpt-4'}
-        }
-        return model
+        """Mock for GenAI translation model, shared across the module."""
+        return AsyncMock(spec=TranslationModel)
 
-    @pytest.fixture
+    @pytest.fixture(scope='module')
     def mock_cache(self):
-        """Mock for Redis cache client."""
-        cache = AsyncMock()
-        cache.get.return_value = None
-        cache.setex.return_value = True
-        return cache
+        """Mock for Redis cache client, shared across the module."""
+        mock_client = AsyncMock(spec=redis.asyncio.Redis)
+        # redis-py declares commands as plain defs returning awaitables
+        mock_client.get = AsyncMock()
+        mock_client.setex = AsyncMock()
+        return mock_client
+
+    @pytest.fixture(scope='module')
+    def mock_validation_service(self):
+        """Mock for validation service, shared across the module."""
+        mock_service = AsyncMock(spec=ValidationService)
+        # TranslationService awaits validate_detection
+        mock_service.validate_detection = AsyncMock()
+        return mock_service
 
     @pytest.fixture
-    def mock_validation_service(self):
-        """Mock for validation service."""
-        validator = AsyncMock()
-        validator.validate_detection.return_value = {
+    def cached_result(self):
+        """Translation result as previously stored in the shared cache."""
+        return TranslationResult(
+            translated_text='Cached translation',
+            confidence_score=0.98,
+            source_format='splunk',
+            target_format='sigma',
+            validation_result={'is_valid': True},
+            metadata={'cached': True}
+        )
+
+    @pytest.fixture(autouse=True)
+    def _reset_mocks(self, mock_translation_model, mock_cache, mock_validation_service):
+        """Reset shared mocks and restore default responses before each test."""
+        for mock in (mock_translation_model, mock_cache, mock_validation_service):
+            mock.reset_mock(return_value=True, side_effect=True)
+
+        mock_translation_model.translate_detection.return_value = {
+            'translated_text': 'Translated detection',
+            'confidence_score': 0.95,
+            'metadata': {'model': 'gpt-4'}
+        }
+        mock_cache.get.return_value = None
+        mock_cache.setex.return_value = True
+        mock_validation_service.validate_detection.return_value = {
             'is_valid': True,
             'validation_result': {'errors': [], 'warnings': []},
             'confidence_score': 0.95
         }
-        return validator
 
     @pytest.mark.asyncio
     async def test_translation_service_initialization(self, translation_service):
@@ -105,7 +136,11 @@ class TestTranslationService:
         assert translation_service._validation_service is not None
 
     @pytest.mark.asyncio
-    @pytest.mark.parametrize('source_format,target_format', FORMAT_COMBINATIONS)
+    @pytest.mark.parametrize(
+        'source_format,target_format',
+        FORMAT_COMBINATIONS,
+        ids=[f"{s}->{t}" for s, t in FORMAT_COMBINATIONS]
+    )
     async def test_format_specific_translations(
         self,
         translation_service,
@@ -135,18 +170,10 @@ class TestTranslationService:
         assert result.validation_result is not None
 
     @pytest.mark.asyncio
-    async def test_translation_with_cache(self, translation_service, mock_cache):
+    async def test_translation_with_cache(self, translation_service, mock_cache, cached_result):
         """Test translation caching functionality."""
         # Setup cache hit scenario
-        cached_result = TranslationResult(
-            translated_text='Cached translation',
-            confidence_score=0.98,
-            source_format='splunk',
-            target_format='sigma',
-            validation_result={'is_valid': True},
-            metadata={'cached': True}
-        )
-        mock_cache.get.return_value = cached_result.json()
+        mock_cache.get.return_value = orjson.dumps(cached_result.model_dump()).decode()
 
         # Execute translation
         result = await translation_service.translate(
@@ -160,6 +187,154 @@ class TestTranslationService:
         assert result.metadata.get('cached') is True
         mock_cache.get.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_validation(
+        self,
+        translation_service,
+        mock_cache,
+        mock_translation_model,
+        mock_validation_service,
+        cached_result
+    ):
+        """Test cache hits return without calling the model or validation service."""
+        mock_cache.get.return_value = orjson.dumps(cached_result.model_dump())
+
+        result = await translation_service.translate(
+            detection_text=SAMPLE_DETECTIONS['splunk'],
+            source_format='splunk',
+            target_format='sigma'
+        )
+
+        assert result.metadata.get('cached') is True
+        mock_translation_model.translate_detection.assert_not_called()
+        mock_validation_service.validate_detection.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_model_validation(
+        self,
+        translation_service,
+        mock_cache,
+        cached_result
+    ):
+        """Test cached results are rebuilt without re-running model validation."""
+        mock_cache.get.return_value = orjson.dumps(cached_result.model_dump())
+
+        with patch.object(TranslationResult, 'model_validate') as mock_validate:
+            result = await translation_service.translate(
+                detection_text=SAMPLE_DETECTIONS['splunk'],
+                source_format='splunk',
+                target_format='sigma'
+            )
+
+        mock_validate.assert_not_called()
+        assert result == cached_result
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_entry_treated_as_miss(
+        self,
+        translation_service,
+        mock_cache,
+        mock_translation_model,
+        cached_result
+    ):
+        """Test cache entries that don't match the current schema fall through to the model."""
+        stale_entry = cached_result.model_dump()
+        del stale_entry['metadata']
+        mock_cache.get.return_value = orjson.dumps(stale_entry)
+
+        result = await translation_service.translate(
+            detection_text=SAMPLE_DETECTIONS['splunk'],
+            source_format='splunk',
+            target_format='sigma'
+        )
+
+        assert result.translated_text == 'Translated detection'
+        mock_translation_model.translate_detection.assert_called_once()
+
+    def test_translation_result_is_frozen(self):
+        """Test translation results are immutable once built."""
+        result = TranslationResult(
+            translated_text='Translated detection',
+            confidence_score=0.95,
+            source_format='splunk',
+            target_format='sigma',
+            validation_result={'is_valid': True},
+            metadata={}
+        )
+        with pytest.raises(pydantic.ValidationError):
+            result.confidence_score = 0.5
+
+    @pytest.mark.asyncio
+    async def test_translation_cache_write(self, translation_service, mock_cache):
+        """Test successful translations are cached as orjson payloads."""
+        mock_cache.get.return_value = None
+
+        result = await translation_service.translate(
+            detection_text='Test detection',
+            source_format='splunk',
+            target_format='sigma'
+        )
+
+        mock_cache.setex.assert_called_once()
+        cached_payload = mock_cache.setex.call_args[0][2]
+        assert isinstance(cached_payload, bytes)
+        assert TranslationResult.model_validate(orjson.loads(cached_payload)) == result
+
+    @pytest.mark.asyncio
+    async def test_repeat_translation_served_from_local_cache(
+        self,
+        translation_service,
+        mock_translation_model,
+        mock_cache
+    ):
+        """Test identical requests after a cached translation skip Redis and the model."""
+        first = await translation_service.translate(
+            detection_text=SAMPLE_DETECTIONS['splunk'],
+            source_format='splunk',
+            target_format='sigma'
+        )
+        second = await translation_service.translate(
+            detection_text=SAMPLE_DETECTIONS['splunk'],
+            source_format='splunk',
+            target_format='sigma'
+        )
+
+        assert second is first
+        mock_translation_model.translate_detection.assert_called_once()
+        mock_cache.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_key_uses_blake3_prefix(self, translation_service, mock_cache):
+        """Test cache keys are derived from the blake3 digest of the detection text."""
+        detection_text = SAMPLE_DETECTIONS['sigma']
+        await translation_service.translate(
+            detection_text=detection_text,
+            source_format='sigma',
+            target_format='splunk'
+        )
+
+        expected_hash = blake3.blake3(detection_text.encode()).hexdigest(16)
+        mock_cache.get.assert_called_once_with(f"translation:sigma:splunk:{expected_hash}")
+
+    @pytest.mark.asyncio
+    async def test_detection_hashed_once_per_translation(
+        self,
+        translation_service,
+        mock_cache,
+        cached_result
+    ):
+        """Test detection text is hashed exactly once per translate call."""
+        mock_cache.get.return_value = orjson.dumps(cached_result.model_dump())
+
+        with patch('blake3.blake3', wraps=blake3.blake3) as mock_hash:
+            await translation_service.translate(
+                detection_text=SAMPLE_DETECTIONS['splunk'],
+                source_format='splunk',
+                target_format='sigma'
+            )
+
+        assert mock_hash.call_count == 1
+
     @pytest.mark.asyncio
     async def test_batch_translation(self, translation_service):
         """Test batch translation functionality."""
@@ -189,6 +364,56 @@ class TestTranslationService:
         assert result.total_time > 0
         assert result.metadata.get('batch_size') == len(batch_detections)
 
+    @pytest.mark.asyncio
+    async def test_batch_translate_iter_streams_results(
+        self,
+        translation_service,
+        mock_translation_model,
+        mock_validation_service
+    ):
+        """Test streamed batch results are yielded as soon as each translation completes."""
+        mock_validation_service.validate_detection.return_value = Mock(
+            is_valid=True,
+            model_dump=Mock(return_value={'is_valid': True})
+        )
+        slow_done = asyncio.Event()
+
+        async def translate_with_delay(**kwargs):
+            if kwargs['source_format'] == 'splunk':
+                await asyncio.sleep(0.2)
+                slow_done.set()
+            return {
+                'translated_text': f"translated {kwargs['source_format']}",
+                'confidence_score': 0.95,
+                'metadata': {'model': 'gpt-4'}
+            }
+
+        mock_translation_model.translate_detection.side_effect = translate_with_delay
+        batch_detections = [
+            {
+                'detection_text': SAMPLE_DETECTIONS['splunk'],
+                'source_format': 'splunk',
+                'target_format': 'sigma'
+            },
+            {
+                'detection_text': SAMPLE_DETECTIONS['sigma'],
+                'source_format': 'sigma',
+                'target_format': 'qradar'
+            }
+        ]
+
+        results = []
+        async for index, result in translation_service.batch_translate_iter(batch_detections):
+            if not results:
+                # Fast item arrives while the slow one is still in flight
+                assert not slow_done.is_set()
+            results.append((index, result))
+
+        assert len(results) == len(batch_detections)
+        assert [index for index, _ in results] == [1, 0]
+        assert results[0][1].source_format == 'sigma'
+        assert results[1][1].source_format == 'splunk'
+
     @pytest.mark.asyncio
     async def test_translation_error_handling(self, translation_service, mock_translation_model):
         """Test error handling in translation process."""
@@ -232,7 +457,7 @@ class TestTranslationService:
     @pytest.mark.asyncio
     async def test_metrics_collection(self, translation_service):
         """Test metrics collection during translation."""
-        with patch('prometheus_client.Counter.labels') as mock_counter:
+        with patch.object(translation_module, '_get_counter') as mock_get_counter:
             await translation_service.translate(
                 detection_text='Test detection',
                 source_format='splunk',
@@ -240,8 +465,24 @@ class TestTranslationService:
             )
             
             # Verify metrics collection
+            mock_counter = mock_get_counter.return_value.labels
             mock_counter.assert_called()
-            assert mock_counter.call_count >= 2  # Start and success metrics
+            assert mock_counter.call_count >= 2  # Start and success/error metrics
+
+    @pytest.mark.asyncio
+    async def test_metrics_disabled_skips_collectors(self, translation_service):
+        """Test no collectors are created or updated when metrics are disabled."""
+        translation_service._metrics_enabled = False
+        with patch.object(translation_module, '_get_counter') as mock_get_counter, \
+             patch.object(translation_module, '_get_histogram') as mock_get_histogram:
+            await translation_service.translate(
+                detection_text='Test detection',
+                source_format='splunk',
+                target_format='sigma'
+            )
+
+        mock_get_counter.assert_not_called()
+        mock_get_histogram.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_invalid_format_handling(self, translation_service):
@@ -252,7 +493,12 @@ class TestTranslationService:
                 source_format='invalid',
                 target_format='sigma'
             )
-        assert "Unsupported format" in str(exc_info.value)
+        assert "Unsupported format: invalid" in str(exc_info.value)
+
+    def test_supported_formats_is_frozenset(self):
+        """Test supported formats use a frozenset for constant-time membership checks."""
+        assert isinstance(SUPPORTED_FORMATS, frozenset)
+        assert {'splunk', 'sigma', 'qradar', 'kql'} <= SUPPORTED_FORMATS
 
     @pytest.mark.asyncio
     async def test_empty_detection_handling(self, translation_service):
@@ -293,4 +539,109 @@ class TestTranslationService:
 
         assert result.success_count == 2
         assert result.failure_count == 1
-        assert len(result.results) == 2  # Only successful translations
\ No newline at end of file
+        assert len(result.results) == 2  # Only successful translations
+
+    @pytest.mark.asyncio
+    async def test_service_batch_translate_detections_keeps_order(self, translation_service):
+        """Test service-level batch translation returns one slot per request, in order."""
+        requests = [
+            {'detection_text': 'Test detection', 'source_format': 'splunk', 'target_format': 'sigma'},
+            {'detection_text': 'Test detection', 'source_format': 'invalid', 'target_format': 'sigma'}
+        ]
+
+        results = await translation_service.batch_translate_detections(requests)
+
+        assert len(results) == len(requests)
+        assert isinstance(results[1], ValueError)
+
+    @pytest.mark.asyncio
+    async def test_coalescing_batches_concurrent_calls(self, mock_translation_model):
+        """Test concurrent translations are coalesced into batched model calls."""
+        mock_translation_model.batch_translate_detections.side_effect = lambda requests: [
+            {
+                'translated_text': f"Translated {request['detection_text']}",
+                'confidence_score': 0.95,
+                'metadata': {'model': 'gpt-4'}
+            }
+            for request in requests
+        ]
+        coalescer = CoalescingTranslator(mock_translation_model, max_batch=50, max_wait_ms=10)
+
+        results = await asyncio.gather(*(
+            coalescer.translate_detection(
+                detection_text=f'Test {i}',
+                source_format='splunk',
+                target_format='sigma'
+            )
+            for i in range(50)
+        ))
+        await coalescer.close()
+
+        assert [r['translated_text'] for r in results] == [f'Translated Test {i}' for i in range(50)]
+        assert mock_translation_model.batch_translate_detections.call_count in (1, 2)
+        mock_translation_model.translate_detection.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_coalescing_respects_max_wait(self, mock_translation_model):
+        """Test a lone request waits exactly one batching window before dispatch."""
+        max_wait_ms = 50
+        mock_translation_model.batch_translate_detections.side_effect = lambda requests: [
+            {'translated_text': 'Translated', 'confidence_score': 0.95, 'metadata': {}}
+            for _ in requests
+        ]
+        coalescer = CoalescingTranslator(mock_translation_model, max_wait_ms=max_wait_ms)
+
+        with patch.object(translation_module.asyncio, 'sleep', new=AsyncMock()) as mock_sleep:
+            result = await coalescer.translate_detection(
+                detection_text='Test detection',
+                source_format='splunk',
+                target_format='sigma'
+            )
+        await coalescer.close()
+
+        assert result['translated_text'] == 'Translated'
+        mock_sleep.assert_awaited_once_with(max_wait_ms / 1000)
+        mock_translation_model.batch_translate_detections.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_coalescing_close_fails_waiting_requests(self, mock_translation_model):
+        """Test closing while a batch is still filling fails its callers instead of hanging."""
+        coalescer = CoalescingTranslator(mock_translation_model, max_wait_ms=60_000)
+        pending = asyncio.create_task(coalescer.translate_detection(
+            detection_text='Test detection',
+            source_format='splunk',
+            target_format='sigma'
+        ))
+        # Let the runner dequeue the request and start its batching wait
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        await coalescer.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            await asyncio.wait_for(pending, timeout=1)
+        mock_translation_model.batch_translate_detections.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_coalescing_fails_requests_missing_from_batch_results(self, mock_translation_model):
+        """Test callers without a matching batch result get an error rather than hanging."""
+        mock_translation_model.batch_translate_detections.side_effect = lambda requests: [
+            {'translated_text': 'Translated', 'confidence_score': 0.95, 'metadata': {}}
+        ]
+        coalescer = CoalescingTranslator(mock_translation_model, max_batch=2, max_wait_ms=10)
+
+        results = await asyncio.wait_for(asyncio.gather(
+            *(
+                coalescer.translate_detection(
+                    detection_text=f'Test {i}',
+                    source_format='splunk',
+                    target_format='sigma'
+                )
+                for i in range(2)
+            ),
+            return_exceptions=True
+        ), timeout=1)
+        await coalescer.close()
+
+        assert results[0]['translated_text'] == 'Translated'
+        assert isinstance(results[1], RuntimeError)
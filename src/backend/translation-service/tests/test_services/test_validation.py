@@ -117,6 +117,22 @@ class TestValidationService:
                   for error in result.errors['SYNTAX'])
         assert result.dimension_scores['syntax_score'] < 0.95
 
+    @pytest.mark.splunk
+    @pytest.mark.parametrize('detection', [
+        '| stats count by host,\n    user',
+        'search source=windows\n| where CommandLine=\n    "*cmd.exe*"\n| table host',
+        'search source=windows EventCode=4688,4689\n| stats count by host'
+    ])
+    def test_validate_detection_multiline_splunk(self, validation_service, detection):
+        """Test clauses continued on the next line are not flagged as incomplete."""
+        result = validation_service.validate_detection(
+            detection_text=detection,
+            format_type='splunk'
+        )
+
+        assert not any('incomplete statement' in error.lower()
+                       for error in result.errors.get('SYNTAX', []))
+
     @pytest.mark.sigma
     def test_validate_detection_valid_sigma(self, validation_service):
         """Test validation of a correctly formatted SIGMA detection."""
@@ -158,6 +174,28 @@ class TestValidationService:
         assert all(isinstance(result, ValidationResult) for result in results)
         assert all(hasattr(result, 'confidence_score') for result in results)
 
+    @pytest.mark.batch
+    def test_batch_uses_thread_pool(self, validation_service):
+        """Test batch validation submits every detection to the worker pool in order."""
+        # Arrange
+        batch_detections = [
+            {'content': self._test_data['splunk'], 'format': 'splunk'},
+            {'content': self._test_data['invalid'], 'format': 'splunk'},
+            {'content': self._test_data['sigma'], 'format': 'sigma'}
+        ]
+        executor = validation_service._executor
+
+        # Act
+        with patch.object(executor, 'submit', wraps=executor.submit) as mock_submit:
+            results = validation_service.validate_batch(batch_detections)
+
+        # Assert
+        assert mock_submit.call_count == len(batch_detections)
+        assert len(results) == len(batch_detections)
+        assert not results[0].errors['SYNTAX']
+        assert any('incomplete statement' in error.lower()
+                  for error in results[1].errors['SYNTAX'])
+
     @pytest.mark.configuration
     def test_validation_thresholds(self, validation_service):
         """Test validation threshold configuration and enforcement."""
@@ -229,6 +267,18 @@ class TestValidationService:
         assert all(isinstance(result, ValidationResult) for result in results)
         assert all(hasattr(result, 'confidence_score') for result in results)
 
+    @pytest.mark.performance
+    def test_splunk_patterns_precompiled(self, validation_service):
+        """Test Splunk syntax checks do not compile regexes per call."""
+        with patch('re.compile') as mock_compile:
+            for _ in range(100):
+                validation_service.validate_detection(
+                    detection_text=self._test_data['invalid'],
+                    format_type='splunk'
+                )
+
+        mock_compile.assert_not_called()
+
     @pytest.mark.validation
     def test_validation_result_details(self, validation_service):
         """Test comprehensive validation result details."""
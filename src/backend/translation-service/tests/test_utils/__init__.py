@@ -130,21 +130,36 @@ def cleanup_test_environment() -> None:
     except Exception:
         pass  # Ignore cleanup errors in test environment
 
+@pytest.fixture(scope="session")
+def _test_env_singleton():
+    """
+    Session-scoped fixture that builds the isolated logger and mock metrics once.
+
+    Yields:
+        Tuple of (test logger, its memory buffer handler, test metrics manager)
+    """
+    logger = setup_test_logger()
+    # setup_test_logger attaches the buffer last; hold it before other handlers are added
+    memory_handler = logger.handlers[-1]
+    metrics_manager = setup_test_metrics()
+
+    yield logger, memory_handler, metrics_manager
+
+    cleanup_test_environment()
+
 @pytest.fixture(autouse=True)
-def test_environment():
+def test_environment(_test_env_singleton):
     """
-    Pytest fixture to automatically set up and tear down test environment.
+    Pytest fixture to automatically reset the shared test environment.
     
     This fixture:
-    - Configures isolated logging
-    - Sets up mock metrics
-    - Cleans up resources after each test
+    - Reuses the session logger and mock metrics
+    - Clears buffered log records after each test
+    - Resets mock collectors after each test
     """
-    # Setup
-    setup_test_logger()
-    setup_test_metrics()
-    
     yield
-    
-    # Teardown
-    cleanup_test_environment()
\ No newline at end of file
+
+    _, memory_handler, metrics_manager = _test_env_singleton
+    memory_handler.buffer.clear()
+    for collector in metrics_manager._collectors.values():
+        collector.reset_mock()
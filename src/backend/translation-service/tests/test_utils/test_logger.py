@@ -11,14 +11,22 @@ import pytest  # version: 7.4.3
 from unittest.mock import patch, MagicMock
 import json  # version: 3.11+
 import logging
+import queue
+import sys
 import uuid
 from typing import Any, Dict
 
 from ...translation_service.utils.logger import (
+    TRACE_ID_CTX_VAR,
     get_logger,
     set_trace_id,
     get_trace_id,
-    JsonFormatter
+    is_valid_trace_id,
+    is_safe_trace_id,
+    JsonFormatter,
+    DeferredFormatQueueHandler,
+    TraceIDFilter,
+    REDACTED_VALUE
 )
 
 # Test constants
@@ -31,6 +39,23 @@ TEST_EXTRA_FIELDS = {
     "duration_ms": 150
 }
 
+@pytest.fixture(scope='module')
+def logger() -> logging.Logger:
+    """Logger configured once for the module; named apart so other tests' reconfiguration can't touch it."""
+    return get_logger(f"{TEST_LOGGER_NAME}.shared")
+
+@pytest.fixture(scope='module')
+def log_handler(logger: logging.Logger) -> logging.Handler:
+    """Primary handler of the shared module logger."""
+    return logger.handlers[0]
+
+@pytest.fixture
+def clean_trace_id():
+    """Start each test with no trace ID and restore the context afterwards."""
+    token = TRACE_ID_CTX_VAR.set('')
+    yield
+    TRACE_ID_CTX_VAR.reset(token)
+
 @pytest.mark.parametrize('env,expected_level', [
     ('development', 'DEBUG'),
     ('staging', 'INFO'),
@@ -109,13 +134,98 @@ def test_json_formatter(log_data: Any) -> None:
         if isinstance(value, str):
             assert len(value) <= formatter._max_field_length
 
-@pytest.mark.asyncio
+def test_json_formatter_record_fields_override_defaults() -> None:
+    """Test record extra fields win over pre-encoded default fields without duplicate keys."""
+    formatter = JsonFormatter(default_fields={'service': 'translation-service', 'environment': 'test'})
+    record = logging.LogRecord(
+        name=TEST_LOGGER_NAME,
+        level=logging.INFO,
+        pathname='test_logger.py',
+        lineno=1,
+        msg='override',
+        args=(),
+        exc_info=None
+    )
+    record.extra_fields = {'service': 'worker'}
+
+    formatted_log = formatter.format(record)
+    parsed_log = json.loads(formatted_log)
+
+    assert formatted_log.count('"service"') == 1
+    assert parsed_log['service'] == 'worker'
+    assert parsed_log['environment'] == 'test'
+
+def test_json_formatter_timestamp_format() -> None:
+    """Test timestamps are UTC ISO-8601 with milliseconds and track the record time."""
+    formatter = JsonFormatter()
+    record = logging.LogRecord(
+        name=TEST_LOGGER_NAME,
+        level=logging.INFO,
+        pathname='test_logger.py',
+        lineno=1,
+        msg=TEST_LOG_MESSAGE,
+        args=(),
+        exc_info=None
+    )
+
+    record.created = 1700000000.25
+    assert json.loads(formatter.format(record))['timestamp'] == '2023-11-14T22:13:20.250Z'
+
+    # Same second reuses the cached prefix; a new second refreshes it
+    record.created = 1700000000.999
+    assert json.loads(formatter.format(record))['timestamp'] == '2023-11-14T22:13:20.999Z'
+    record.created = 1700000001.0
+    assert json.loads(formatter.format(record))['timestamp'] == '2023-11-14T22:13:21.000Z'
+
+def test_json_formatter_serializes_non_json_types() -> None:
+    """Test JSON formatter stringifies values the JSON encoder has no native mapping for."""
+    formatter = JsonFormatter()
+    record_uuid = uuid.uuid4()
+    record = logging.LogRecord(
+        name=TEST_LOGGER_NAME,
+        level=logging.INFO,
+        pathname='test_logger.py',
+        lineno=1,
+        msg=TEST_LOG_MESSAGE,
+        args=(),
+        exc_info=None
+    )
+    record.extra_fields = {'request_id': record_uuid, 'tags': frozenset({'a'})}
+
+    parsed_log = json.loads(formatter.format(record))
+
+    assert parsed_log['message'] == TEST_LOG_MESSAGE
+    assert parsed_log['request_id'] == str(record_uuid)
+    assert parsed_log['tags'] == str(frozenset({'a'}))
+
+def test_json_formatter_includes_flat_extra_fields() -> None:
+    """Test keys passed directly via extra= are emitted and go through redaction."""
+    formatter = JsonFormatter()
+    test_logger = logging.getLogger(f"{TEST_LOGGER_NAME}.flat_extra")
+    record = test_logger.makeRecord(
+        test_logger.name, logging.INFO, 'test_logger.py', 1, TEST_LOG_MESSAGE, (), None,
+        extra={'source_format': 'splunk', 'duration_ms': 150, 'password': 'secret123'}
+    )
+
+    parsed_log = json.loads(formatter.format(record))
+
+    assert parsed_log['source_format'] == 'splunk'
+    assert parsed_log['duration_ms'] == 150
+    assert parsed_log['password'] == REDACTED_VALUE
+    assert 'pathname' not in parsed_log
+    assert 'extra_fields' not in parsed_log
+
+@pytest.mark.usefixtures('clean_trace_id')
 @pytest.mark.parametrize('trace_id', [
     str(uuid.uuid4()),  # Valid UUID
     None,  # No trace ID
     'invalid-trace-id'  # Invalid format
 ])
-async def test_trace_id_management(trace_id: str) -> None:
+def test_trace_id_management(
+    trace_id: str,
+    logger: logging.Logger,
+    log_handler: logging.Handler
+) -> None:
     """Test trace ID functionality and propagation."""
     # Test trace ID setting
     if trace_id is None:
@@ -134,11 +244,10 @@ async def test_trace_id_management(trace_id: str) -> None:
             assert current_trace_id == ''
 
     # Test trace ID in logs
-    logger = get_logger(TEST_LOGGER_NAME)
-    with patch.object(logger.handlers[0], 'emit') as mock_emit:
+    with patch.object(log_handler, 'emit') as mock_emit:
         logger.info(TEST_LOG_MESSAGE)
         record = mock_emit.call_args[0][0]
-        formatted_log = logger.handlers[0].formatter.format(record)
+        formatted_log = log_handler.formatter.format(record)
         parsed_log = json.loads(formatted_log)
         
         if trace_id and len(trace_id) == 36:
@@ -150,6 +259,35 @@ async def test_trace_id_management(trace_id: str) -> None:
         else:
             assert 'trace_id' not in parsed_log
 
+@pytest.mark.parametrize('trace_id,expected', [
+    (TEST_TRACE_ID, True),
+    (TEST_TRACE_ID.replace('-', ''), True),
+    (TEST_TRACE_ID.upper(), True),
+    (TEST_TRACE_ID[:8] + TEST_TRACE_ID[9:], False),  # Mixed dash layout
+    (TEST_TRACE_ID + '\n', False),
+    ('invalid-trace-id', False),
+    ('', False),
+    (None, False)
+])
+def test_is_valid_trace_id(trace_id: Any, expected: bool) -> None:
+    """Test trace ID format validation without UUID parsing."""
+    assert is_valid_trace_id(trace_id) is expected
+
+@pytest.mark.parametrize('trace_id,expected', [
+    (TEST_TRACE_ID, True),
+    ('invalid-trace-id', True),  # Non-UUID upstream IDs are propagated
+    ('Root=1-5759e988-bd862e3fe1be46a994272793', True),
+    ('x' * 128, True),
+    ('x' * 129, False),
+    ('abc\r\nSet-Cookie: a=b', False),
+    ('id with spaces', False),
+    ('', False),
+    (None, False)
+])
+def test_is_safe_trace_id(trace_id: Any, expected: bool) -> None:
+    """Test inbound trace IDs are kept when bounded and limited to a safe charset."""
+    assert is_safe_trace_id(trace_id) is expected
+
 @pytest.mark.integration
 @pytest.mark.parametrize('environment', ['development', 'staging', 'production'])
 def test_logger_integration(environment: str) -> None:
@@ -225,4 +363,111 @@ def test_logger_security() -> None:
         assert 'api_key' not in str(extra_fields)
         assert 'token' not in str(extra_fields)
         assert 'secret123' not in str(extra_fields)
-        assert 'bearer123' not in str(extra_fields)
\ No newline at end of file
+        assert 'bearer123' not in str(extra_fields)
+
+def test_json_formatter_redacts_sensitive_fields() -> None:
+    """Test sensitive extra fields are redacted by key and by value content."""
+    formatter = JsonFormatter()
+    record = logging.LogRecord(
+        name=TEST_LOGGER_NAME,
+        level=logging.INFO,
+        pathname='test_logger.py',
+        lineno=1,
+        msg="Security test",
+        args=(),
+        exc_info=None
+    )
+    record.extra_fields = {
+        'Password': 'secret123',
+        'api_key': 'key123',
+        'auth_header': 'Bearer abc123',
+        'safe_field': 'public_data'
+    }
+
+    parsed_log = json.loads(formatter.format(record))
+
+    assert parsed_log['Password'] == REDACTED_VALUE
+    assert parsed_log['api_key'] == REDACTED_VALUE
+    assert parsed_log['auth_header'] == REDACTED_VALUE
+    assert parsed_log['safe_field'] == 'public_data'
+    assert 'secret123' not in json.dumps(parsed_log)
+
+def test_json_formatter_redacts_sensitive_key_variants() -> None:
+    """Test keys containing a sensitive word are redacted while harmless values are kept."""
+    formatter = JsonFormatter()
+    record = logging.LogRecord(
+        name=TEST_LOGGER_NAME,
+        level=logging.INFO,
+        pathname='test_logger.py',
+        lineno=1,
+        msg="Security test",
+        args=(),
+        exc_info=None
+    )
+    record.extra_fields = {
+        'db_password': 'hunter2',
+        'auth_token': 'abc123',
+        'x-api-key': 'key123',
+        'conn_string': 'postgres://app?password=hunter2',
+        'max_tokens': 1024,
+        'error': 'invalid token in query'
+    }
+
+    parsed_log = json.loads(formatter.format(record))
+
+    assert parsed_log['db_password'] == REDACTED_VALUE
+    assert parsed_log['auth_token'] == REDACTED_VALUE
+    assert parsed_log['conn_string'] == REDACTED_VALUE
+    assert 'key123' not in json.dumps(parsed_log)
+    assert parsed_log['max_tokens'] == 1024
+    assert parsed_log['error'] == 'invalid token in query'
+
+def test_trace_id_filter_carries_trace_id_across_threads(clean_trace_id) -> None:
+    """Test queued records keep the producer's trace ID when formatted elsewhere."""
+    log_queue = queue.SimpleQueue()
+    handler = DeferredFormatQueueHandler(log_queue)
+    handler.addFilter(TraceIDFilter())
+    record = logging.LogRecord(
+        name=TEST_LOGGER_NAME,
+        level=logging.INFO,
+        pathname='test_logger.py',
+        lineno=1,
+        msg=TEST_LOG_MESSAGE,
+        args=(),
+        exc_info=None
+    )
+
+    TRACE_ID_CTX_VAR.set(TEST_TRACE_ID)
+    handler.handle(record)
+    # Simulate the listener thread, which does not share the request context
+    TRACE_ID_CTX_VAR.set('')
+
+    parsed_log = json.loads(JsonFormatter().format(log_queue.get_nowait()))
+    assert parsed_log['trace_id'] == TEST_TRACE_ID
+
+def test_queue_handler_defers_formatting_and_keeps_exception() -> None:
+    """Test queued records keep args and exc_info so the listener's formatter renders them."""
+    log_queue = queue.SimpleQueue()
+    handler = DeferredFormatQueueHandler(log_queue)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.LogRecord(
+            name=TEST_LOGGER_NAME,
+            level=logging.ERROR,
+            pathname='test_logger.py',
+            lineno=1,
+            msg='failed %s',
+            args=('translation',),
+            exc_info=sys.exc_info()
+        )
+
+    handler.handle(record)
+    queued = log_queue.get_nowait()
+
+    assert queued.msg == 'failed %s'
+    assert queued.args == ('translation',)
+    assert queued.exc_info is not None
+    parsed_log = json.loads(JsonFormatter().format(queued))
+    assert parsed_log['message'] == 'failed translation'
+    assert 'ValueError: boom' in parsed_log['exception']
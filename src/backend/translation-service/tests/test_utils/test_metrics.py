@@ -13,13 +13,16 @@ Version: 1.0.0
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from prometheus_client import REGISTRY, Counter, Gauge, Histogram  # version: 0.17.1
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Histogram  # version: 0.17.1
+from prometheus_client.parser import text_string_to_metric_families  # version: 0.17.1
 import asyncio
 import time
 
 from ...translation_service.utils.metrics import (
     MetricsManager,
+    get_metric,
     track_translation,
+    TRANSLATION_COUNTER,
     track_validation,
     get_metrics,
     reset_metrics
@@ -29,18 +32,24 @@ from ...translation_service.config.metrics import MetricsConfig
 class TestMetrics:
     """Comprehensive test suite for metrics functionality."""
 
-    def setup_method(self):
-        """Setup test environment before each test."""
-        # Initialize test configuration
-        self._config = MetricsConfig(
+    @pytest.fixture(scope='class')
+    def metrics_manager(self):
+        """Metrics manager shared by every test in the class."""
+        config = MetricsConfig(
             port=9090,
             path='/metrics',
             enabled=True
         )
-        
-        # Initialize metrics manager
-        self._manager = MetricsManager(self._config)
-        
+        # Private registry: teardown just drops it instead of unregistering from the global one
+        manager = MetricsManager(config, registry=CollectorRegistry())
+        yield manager
+        manager._cleanup()
+
+    def setup_method(self):
+        """Setup test environment before each test."""
+        # Allow each test to start its own (mocked) metrics server
+        MetricsManager._server_started = False
+
         # Reset all metrics before each test
         reset_metrics()
         
@@ -56,13 +65,6 @@ class TestMetrics:
 
     def teardown_method(self):
         """Cleanup test environment after each test."""
-        # Stop metrics collection
-        if hasattr(self._manager, '_initialized') and self._manager._initialized:
-            self._manager._cleanup()
-        
-        # Reset all metrics
-        reset_metrics()
-        
         # Unregister test collectors
         for collector in self._collectors:
             try:
@@ -104,24 +106,24 @@ class TestMetrics:
                 assert manager._initialized is True
                 assert manager._health_status['status'] == 'healthy'
 
-    def test_metrics_manager_lifecycle(self):
+    def test_metrics_manager_lifecycle(self, metrics_manager):
         """Test complete metrics manager lifecycle."""
         # Start metrics collection
         with patch('prometheus_client.start_http_server'):
-            self._manager.start()
-            assert self._manager._initialized is True
+            metrics_manager.start()
+            assert metrics_manager._initialized is True
             
             # Record test metrics
-            test_counter = Counter('test_counter', 'Test counter')
+            test_counter = metrics_manager.register_metric(Counter, 'test_counter', 'Test counter')
             test_counter.inc()
             
             # Verify metrics collection
-            metrics = list(REGISTRY.collect())
-            assert any(m.name == 'test_counter' for m in metrics)
+            assert metrics_manager.get_metric('test_counter') is test_counter
+            assert get_metric('test_counter') is None
             
             # Stop metrics collection
-            self._manager._cleanup()
-            assert not any(m.name == 'test_counter' for m in list(REGISTRY.collect()))
+            metrics_manager._cleanup()
+            assert metrics_manager.get_metric('test_counter') is None
 
     @pytest.mark.asyncio
     async def test_track_translation_metrics(self):
@@ -140,24 +142,33 @@ class TestMetrics:
                     target_format=target
                 )
         
-        # Verify metrics
-        metrics = list(REGISTRY.collect())
-        
         # Check translation counter
-        translation_counter = next(
-            m for m in metrics if m.name == 'translation_requests_total'
-        )
-        assert sum(s.value for s in translation_counter.samples) == (
+        translation_counter = get_metric('translation_requests_total').collect()[0]
+        assert sum(
+            s.value for s in translation_counter.samples if s.name.endswith('_total')
+        ) == (
             len(self._test_data['source_formats']) * 
             len(self._test_data['target_formats'])
         )
         
         # Check latency metrics
-        latency_hist = next(
-            m for m in metrics if m.name == 'translation_duration_seconds'
-        )
+        latency_hist = get_metric('translation_duration_seconds').collect()[0]
         assert all(s.value > 0 for s in latency_hist.samples)
 
+    def test_translation_label_children_cached(self):
+        """Test repeated tracking binds each label combination only once."""
+        @track_translation
+        def mock_translate(**kwargs):
+            return {'success': True}
+
+        with patch.object(
+            TRANSLATION_COUNTER, 'labels', wraps=TRANSLATION_COUNTER.labels
+        ) as mock_labels:
+            for _ in range(100):
+                mock_translate(source_format='splunk', target_format='sigma')
+
+        assert mock_labels.call_count == 1
+
     def test_track_validation_metrics(self):
         """Test validation metrics recording."""
         # Record validation metrics
@@ -177,20 +188,15 @@ class TestMetrics:
                 error_type='ValidationError'
             )
         
-        # Verify metrics
-        metrics = list(REGISTRY.collect())
-        
         # Check validation latency
-        validation_hist = next(
-            m for m in metrics if m.name == 'validation_duration_seconds'
-        )
+        validation_hist = get_metric('validation_duration_seconds').collect()[0]
         assert len(validation_hist.samples) > 0
         
         # Verify error tracking
-        error_counter = next(
-            m for m in metrics if m.name == 'translation_errors_total'
-        )
-        assert sum(s.value for s in error_counter.samples) == len(
+        error_counter = get_metric('translation_errors_total').collect()[0]
+        assert sum(
+            s.value for s in error_counter.samples if s.name.endswith('_total')
+        ) == len(
             self._test_data['source_formats']
         )
 
@@ -208,15 +214,16 @@ class TestMetrics:
         test_gauge.set(10)
         test_hist.observe(0.5)
         
-        # Get metrics
-        metrics = get_metrics()
-        
-        # Verify metrics presence
-        assert 'test_metric_counter' in str(metrics)
-        assert 'test_metric_gauge' in str(metrics)
-        assert 'test_metric_hist' in str(metrics)
-        
+        # Parse the exposition text and index samples by name
+        samples = {
+            sample.name: sample.value
+            for family in text_string_to_metric_families(get_metrics())
+            for sample in family.samples
+            if not sample.labels
+        }
+
         # Verify values
-        assert '5.0' in str(metrics)  # Counter value
-        assert '10.0' in str(metrics)  # Gauge value
-        assert '0.5' in str(metrics)  # Histogram observation
\ No newline at end of file
+        assert samples['test_metric_counter_total'] == 5.0
+        assert samples['test_metric_gauge'] == 10.0
+        assert samples['test_metric_hist_sum'] == 0.5
+        assert samples['test_metric_hist_count'] == 1.0
\ No newline at end of file
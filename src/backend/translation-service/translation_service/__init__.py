@@ -8,15 +8,15 @@ Version: 1.0.0
 Author: Detection Translation Team
 """
 
-import functools
+import threading
 from typing import Dict, List, Optional, Any
 from fastapi import FastAPI  # version: 0.104.0
+from fastapi.responses import ORJSONResponse  # version: 0.104.0
 from fastapi.middleware.cors import CORSMiddleware  # version: 0.104.0
 from prometheus_fastapi_instrumentator import Instrumentator  # version: 6.1.0
-from fastapi_limiter import FastAPILimiter  # version: 0.1.5
-import redis.asyncio as redis  # version: 5.0.1
 import time
 
+from .api import register_redis
 from .api.routes import router
 from .services.translation import TranslationService
 from .config.metrics import get_metrics_config
@@ -39,16 +39,48 @@ DEFAULT_CONFIG = {
     'cors_origins': ['*'],
     'rate_limit': 100,
     'timeout': 30,
-    'redis_url': 'redis://localhost:6379/0'
+    'redis_url': 'redis://localhost:6379/0',
+    'redis_max_connections': 50
 }
 
 # Initialize logger
 logger = get_logger(__name__)
 
-@functools.lru_cache()
+# Process-wide application instance, built by the first create_app call
+_APP: Optional[FastAPI] = None
+_APP_LOCK = threading.Lock()
+
 def create_app(config_path: Optional[str] = None, testing: bool = False) -> FastAPI:
     """
-    Factory function to create and configure the FastAPI application with comprehensive
+    Return the process-wide FastAPI application, building it on first use.
+
+    The settings only apply to the call that builds the application; use
+    clear_app_cache() to rebuild with different ones.
+
+    Args:
+        config_path: Optional path to configuration file
+        testing: Flag to indicate testing environment
+
+    Returns:
+        Configured FastAPI application instance
+    """
+    global _APP
+    with _APP_LOCK:
+        if _APP is None:
+            _APP = _build_app(config_path, testing)
+        return _APP
+
+def clear_app_cache() -> None:
+    """
+    Drop the application instance so the next create_app call rebuilds it.
+    """
+    global _APP
+    with _APP_LOCK:
+        _APP = None
+
+def _build_app(config_path: Optional[str], testing: bool) -> FastAPI:
+    """
+    Create and configure the FastAPI application with comprehensive
     security, monitoring, and performance features.
 
     Args:
@@ -65,7 +97,8 @@ def create_app(config_path: Optional[str] = None, testing: bool = False) -> Fast
             description="AI-Driven Security Detection Translation Platform",
             version=__version__,
             docs_url="/api/docs" if not testing else None,
-            redoc_url="/api/redoc" if not testing else None
+            redoc_url="/api/redoc" if not testing else None,
+            default_response_class=ORJSONResponse
         )
 
         # Load configurations
@@ -82,20 +115,12 @@ def create_app(config_path: Optional[str] = None, testing: bool = False) -> Fast
             expose_headers=["X-Request-ID"]
         )
 
-        # Initialize Redis for rate limiting and caching
-        @app.on_event("startup")
-        async def initialize_redis():
-            redis_client = redis.from_url(
-                DEFAULT_CONFIG['redis_url'],
-                encoding="utf-8",
-                decode_responses=True
-            )
-            await FastAPILimiter.init(redis_client)
-
-        # Configure rate limiting
-        @app.on_event("startup")
-        async def configure_rate_limits():
-            await FastAPILimiter.init(app)
+        # Pooled Redis client for rate limiting and caching, closed on shutdown
+        register_redis(
+            app,
+            DEFAULT_CONFIG['redis_url'],
+            DEFAULT_CONFIG['redis_max_connections']
+        )
 
         # Initialize metrics collection
         if metrics_config.enabled and not testing:
@@ -106,7 +131,7 @@ def create_app(config_path: Optional[str] = None, testing: bool = False) -> Fast
         # Initialize translation service
         translation_service = TranslationService(genai_config)
 
-        # Register routes
+        # Register routes; translation endpoints carry their own rate limit
         app.include_router(router, prefix="/api/v1")
 
         # Add health check endpoint
@@ -121,14 +146,17 @@ def create_app(config_path: Optional[str] = None, testing: bool = False) -> Fast
         # Configure error handlers
         @app.exception_handler(Exception)
         async def global_exception_handler(request, exc):
-            logger.error(f"Global error handler: {str(exc)}")
-            return {"error": "Internal server error", "detail": str(exc)}, 500
+            # Traceback is formatted only if a handler emits the record
+            logger.exception("Global error handler", exc_info=exc)
+            return ORJSONResponse(
+                status_code=500,
+                content={"error": "Internal server error"}
+            )
 
         # Graceful shutdown handler
         @app.on_event("shutdown")
         async def shutdown_event():
             logger.info("Application shutting down")
-            # Add cleanup tasks here
 
         logger.info(
             "Application initialized successfully",
@@ -142,7 +170,7 @@ def create_app(config_path: Optional[str] = None, testing: bool = False) -> Fast
         return app
 
     except Exception as e:
-        logger.error(f"Application initialization failed: {str(e)}")
+        logger.error("Application initialization failed: %s", e)
         raise RuntimeError(f"Failed to create application: {str(e)}")
 
 def configure_logging(log_level: str = 'INFO') -> None:
@@ -158,7 +186,7 @@ def configure_logging(log_level: str = 'INFO') -> None:
             log_level=log_level,
             env="development" if __debug__ else "production"
         )
-        logger.info(f"Logging configured with level: {log_level}")
+        logger.info("Logging configured with level: %s", log_level)
     except Exception as e:
         print(f"Failed to configure logging: {str(e)}")
         raise
@@ -168,5 +196,6 @@ __all__ = [
     '__version__',
     'SUPPORTED_FORMATS',
     'create_app',
+    'clear_app_cache',
     'configure_logging'
 ]
\ No newline at end of file
@@ -9,16 +9,18 @@ Version: 1.0.0
 
 from fastapi import FastAPI, Request, HTTPException  # version: 0.104.0
 from fastapi.middleware.cors import CORSMiddleware  # version: 0.104.0
-from fastapi.responses import JSONResponse
-from prometheus_fastapi_instrumentator import Instrumentator  # version: 6.1.0
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware  # version: 0.27.0
+from fastapi_limiter import FastAPILimiter  # version: 0.1.5
+import redis.asyncio as redis  # version: 5.0.1
+import logging
 import time
-import uuid
+import secrets
 from typing import Dict, Any, Optional
 
 from .routes import router
-from ..utils.logger import get_logger
-from ..utils.metrics import MetricsManager, TRANSLATION_COUNTER
+from ..utils.logger import get_logger, is_safe_trace_id, TRACE_ID_CTX_VAR
+from ..utils.metrics import TRANSLATION_COUNTER
 from ..config.metrics import get_metrics_config
 
 # Initialize logger
@@ -27,55 +29,74 @@ logger = get_logger(__name__)
 # API version and configuration
 API_VERSION = 'v1'
 ALLOWED_ORIGINS = ['*']  # Configure appropriately for production
-MAX_REQUESTS_PER_MINUTE = 100
-
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate limiting middleware with token bucket algorithm."""
-    
-    def __init__(self, app, max_requests: int = MAX_REQUESTS_PER_MINUTE):
-        super().__init__(app)
-        self._requests = {}
-        self._max_requests = max_requests
-        self._window = 60  # 1 minute window
-
-    async def dispatch(self, request: Request, call_next):
-        # Get client identifier (IP or token)
-        client_id = request.client.host
-        
-        # Check rate limit
-        current_time = time.time()
-        if client_id in self._requests:
-            requests = [ts for ts in self._requests[client_id] 
-                       if current_time - ts < self._window]
-            if len(requests) >= self._max_requests:
-                logger.warning(f"Rate limit exceeded for client: {client_id}")
-                return JSONResponse(
-                    status_code=429,
-                    content={"error": "Rate limit exceeded. Please try again later."}
-                )
-            self._requests[client_id] = requests
-        else:
-            self._requests[client_id] = []
-            
-        self._requests[client_id].append(current_time)
-        return await call_next(request)
+REDIS_MAX_CONNECTIONS = 50
+DEFAULT_REDIS_URL = 'redis://localhost:6379/0'
 
 class RequestTracingMiddleware(BaseHTTPMiddleware):
     """Middleware for request tracing and correlation IDs."""
     
     async def dispatch(self, request: Request, call_next):
-        # Generate or get trace ID
-        trace_id = request.headers.get('X-Trace-ID', str(uuid.uuid4()))
+        # Keep the caller's trace ID so logs correlate across services; only
+        # missing or unsafe values are replaced
+        trace_id = request.headers.get('X-Trace-ID')
+        if not is_safe_trace_id(trace_id):
+            if trace_id:
+                logger.warning(
+                    "Replacing malformed X-Trace-ID header (%d chars)", len(trace_id)
+                )
+            # 128 random bits as compact hex; accepted by is_valid_trace_id
+            trace_id = secrets.token_hex(16)
         
         # Add trace ID to request state
         request.state.trace_id = trace_id
         
+        # Bind trace ID to this request's context so log records pick it up
+        token = TRACE_ID_CTX_VAR.set(trace_id)
+        try:
+            response = await call_next(request)
+        finally:
+            TRACE_ID_CTX_VAR.reset(token)
+
         # Add trace ID to response headers
-        response = await call_next(request)
         response.headers['X-Trace-ID'] = trace_id
         
         return response
 
+def register_redis(
+    app: FastAPI,
+    redis_url: str = DEFAULT_REDIS_URL,
+    max_connections: int = REDIS_MAX_CONNECTIONS
+) -> None:
+    """
+    Tie a pooled Redis client to the application's lifecycle.
+
+    The client is opened on startup, kept on app.state.redis and handed to the
+    rate limiter, then closed with its pool on shutdown.
+
+    Args:
+        app: Application to register the startup and shutdown hooks on
+        redis_url: Redis connection URL
+        max_connections: Connection pool size
+    """
+    @app.on_event("startup")
+    async def open_redis():
+        pool = redis.ConnectionPool.from_url(
+            redis_url,
+            max_connections=max_connections,
+            encoding="utf-8",
+            decode_responses=True
+        )
+        app.state.redis = redis.Redis(connection_pool=pool)
+        await FastAPILimiter.init(app.state.redis)
+
+    @app.on_event("shutdown")
+    async def close_redis():
+        redis_client = getattr(app.state, 'redis', None)
+        if redis_client is not None:
+            app.state.redis = None
+            await redis_client.close()
+            await redis_client.connection_pool.disconnect()
+
 def init_api(translation_service: Any, config: Optional[Dict[str, Any]] = None) -> FastAPI:
     """
     Initialize and configure the FastAPI application with comprehensive security and monitoring.
@@ -93,7 +114,8 @@ def init_api(translation_service: Any, config: Optional[Dict[str, Any]] = None)
         description="Enterprise-grade security detection translation service",
         version=API_VERSION,
         docs_url=f"/api/{API_VERSION}/docs",
-        redoc_url=f"/api/{API_VERSION}/redoc"
+        redoc_url=f"/api/{API_VERSION}/redoc",
+        default_response_class=ORJSONResponse
     )
 
     # Configure CORS
@@ -108,32 +130,26 @@ def init_api(translation_service: Any, config: Optional[Dict[str, Any]] = None)
     # Add request tracing middleware
     app.add_middleware(RequestTracingMiddleware)
 
-    # Add rate limiting middleware
-    app.add_middleware(
-        RateLimitMiddleware,
-        max_requests=MAX_REQUESTS_PER_MINUTE
-    )
+    # Rate limiting is enforced in Redis so the window is shared across workers
+    register_redis(app, (config or {}).get('redis_url', DEFAULT_REDIS_URL))
 
-    # Initialize metrics
+    # Metrics exposition is owned by create_app; only the config is read here
     metrics_config = get_metrics_config()
-    if metrics_config.enabled:
-        Instrumentator().instrument(app).expose(metrics_config.path)
-        metrics_manager = MetricsManager(metrics_config)
-        metrics_manager.start()
 
     # Configure error handlers
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
-        logger.error(
-            f"HTTP error occurred",
-            extra={
-                'status_code': exc.status_code,
-                'detail': exc.detail,
-                'path': request.url.path,
-                'trace_id': getattr(request.state, 'trace_id', None)
-            }
-        )
-        return JSONResponse(
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "HTTP error occurred",
+                extra={
+                    'status_code': exc.status_code,
+                    'detail': exc.detail,
+                    'path': request.url.path,
+                    'trace_id': getattr(request.state, 'trace_id', None)
+                }
+            )
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "error": exc.detail,
@@ -143,15 +159,16 @@ def init_api(translation_service: Any, config: Optional[Dict[str, Any]] = None)
 
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
-        logger.error(
-            f"Unhandled error occurred",
-            extra={
-                'error': str(exc),
-                'path': request.url.path,
-                'trace_id': getattr(request.state, 'trace_id', None)
-            }
-        )
-        return JSONResponse(
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "Unhandled error occurred",
+                extra={
+                    'error': str(exc),
+                    'path': request.url.path,
+                    'trace_id': getattr(request.state, 'trace_id', None)
+                }
+            )
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "Internal server error",
@@ -176,13 +193,13 @@ def init_api(translation_service: Any, config: Optional[Dict[str, Any]] = None)
                 "metrics_enabled": metrics_config.enabled
             }
         except Exception as e:
-            logger.error(f"Health check failed: {str(e)}")
+            logger.error("Health check failed: %s", e)
             raise HTTPException(
                 status_code=503,
                 detail="Service unhealthy"
             )
 
-    # Include API router with version prefix
+    # Include API router with version prefix; rate limits are declared per route
     app.include_router(
         router,
         prefix=f"/api/{API_VERSION}",
@@ -190,7 +207,7 @@ def init_api(translation_service: Any, config: Optional[Dict[str, Any]] = None)
     )
 
     logger.info(
-        f"API initialized successfully",
+        "API initialized successfully",
         extra={
             'version': API_VERSION,
             'metrics_enabled': metrics_config.enabled
@@ -7,15 +7,23 @@ detection translation capabilities, validation, monitoring, and error handling.
 Version: 1.0.0
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Request  # version: 0.104.0
-from pydantic import BaseModel, Field, validator  # version: 2.4.2
-from prometheus_client import Counter, Histogram, Gauge  # version: 0.17.1
-from typing import Dict, List, Optional, Any
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request  # version: 0.104.0
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse  # version: 0.104.0
+from pydantic import BaseModel, Field, field_validator  # version: 2.4.2
+from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST  # version: 0.17.1
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
+import asyncio
+import os
+import sys
 import time
-import uuid
-
-from ..services.translation import TranslationService
-from ..services.validation import ValidationService
+from pathlib import Path
+from secrets import token_hex
+import orjson  # version: 3.9.10
+from fastapi_limiter.depends import RateLimiter  # version: 0.1.5
+
+from ..services.translation import TranslationService, CoalescingTranslator
+from ..services.validation import ValidationService, shutdown_validation_executor
+from ..config.genai import load_config as load_genai_config
 from ..config.metrics import get_metrics_config
 from ..utils.logger import get_logger
 
@@ -23,11 +31,66 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 # Initialize router with prefix and tags
-router = APIRouter(prefix="/api/v1", tags=["translation"])
+router = APIRouter(
+    prefix="/api/v1",
+    tags=["translation"],
+    default_response_class=ORJSONResponse
+)
+
+# Per-client limit on the translation endpoints only; health and metrics are never throttled
+MAX_REQUESTS_PER_MINUTE = 100
+RATE_LIMIT_WINDOW_SECONDS = 60
+_TRANSLATION_RATE_LIMIT = [Depends(RateLimiter(
+    times=MAX_REQUESTS_PER_MINUTE,
+    seconds=RATE_LIMIT_WINDOW_SECONDS
+))]
+
+# Micro-batching of concurrent /translate calls; off by default (1) because the
+# service has no batched model backend, so coalescing only adds the wait below
+TRANSLATE_BATCH_MAX = int(os.getenv('TRANSLATE_BATCH_MAX', '1'))
+TRANSLATE_BATCH_WAIT_MS = float(os.getenv('TRANSLATE_BATCH_WAIT_MS', '10'))
+
+# Optional throwaway translation at startup so the first real request doesn't pay
+# cold-start cost; off by default because it is a billed model call that also
+# counts in the translation metrics and caches, and it is bounded by the timeout
+TRANSLATION_WARMUP = os.getenv('TRANSLATION_WARMUP', 'false').lower() == 'true'
+TRANSLATION_WARMUP_TIMEOUT_S = float(os.getenv('TRANSLATION_WARMUP_TIMEOUT_S', '10'))
+WARMUP_DETECTION = 'search index=_internal | head 1'
 
 # Initialize services
 translation_service = TranslationService()
 validation_service = ValidationService()
+# Created at startup only when TRANSLATE_BATCH_MAX > 1
+translation_batcher: Optional[CoalescingTranslator] = None
+
+# Detection formats accepted by the API
+_VALID_FORMATS = frozenset({
+    'splunk', 'qradar', 'sigma', 'kql', 'paloalto', 'crowdstrike', 'yara', 'yaral'
+})
+_VALID_FORMATS_DISPLAY = ', '.join(sorted(_VALID_FORMATS))
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize pydantic models that orjson cannot encode natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+class ModelORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also encodes pydantic models nested in the content."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS
+        )
+
+# Metrics settings are fixed for the life of the process
+_METRICS_CONFIG = get_metrics_config()
+
+# Healthy /health bodies are reused for this long to keep frequent probes cheap
+HEALTH_CACHE_TTL_SECONDS = 2.0
+_health_cache: Optional[Tuple[float, bytes]] = None
 
 # Initialize metrics
 TRANSLATION_COUNTER = Counter(
@@ -47,6 +110,20 @@ BATCH_SIZE_GAUGE = Gauge(
     'Current batch processing size'
 )
 
+# Label children bound once for every valid format pair; formats are validated before use
+_REQUEST_STATUSES = ('started', 'success', 'error')
+_COUNTER_CHILDREN = {
+    (source, target, status): TRANSLATION_COUNTER.labels(source, target, status)
+    for source in _VALID_FORMATS
+    for target in _VALID_FORMATS
+    for status in _REQUEST_STATUSES
+}
+_DURATION_CHILDREN = {
+    (source, target): TRANSLATION_DURATION.labels(source, target)
+    for source in _VALID_FORMATS
+    for target in _VALID_FORMATS
+}
+
 class TranslationRequest(BaseModel):
     """Enhanced model for single translation request payload."""
     detection_text: str = Field(..., description="Source detection text to translate")
@@ -55,13 +132,15 @@ class TranslationRequest(BaseModel):
     correlation_id: Optional[str] = Field(None, description="Optional correlation ID")
     metadata: Optional[Dict[str, Any]] = Field(None, description="Optional metadata")
 
-    @validator('source_format', 'target_format')
+    @field_validator('source_format', 'target_format')
+    @classmethod
     def validate_formats(cls, value: str) -> str:
         """Validate detection formats."""
-        valid_formats = ['splunk', 'qradar', 'sigma', 'kql', 'paloalto', 'crowdstrike', 'yara', 'yaral']
-        if value.lower() not in valid_formats:
-            raise ValueError(f"Unsupported format: {value}. Valid formats: {', '.join(valid_formats)}")
-        return value.lower()
+        normalized = value.lower()
+        if normalized not in _VALID_FORMATS:
+            raise ValueError(f"Unsupported format: {value}. Valid formats: {_VALID_FORMATS_DISPLAY}")
+        # Interned so downstream label and cache lookups compare by identity
+        return sys.intern(normalized)
 
 class BatchTranslationRequest(BaseModel):
     """Enhanced model for batch translation request payload."""
@@ -69,7 +148,8 @@ class BatchTranslationRequest(BaseModel):
     batch_id: Optional[str] = Field(None, description="Optional batch identifier")
     batch_metadata: Optional[Dict[str, Any]] = Field(None, description="Optional batch metadata")
 
-    @validator('detections')
+    @field_validator('detections')
+    @classmethod
     def validate_batch_size(cls, detections: List[TranslationRequest]) -> List[TranslationRequest]:
         """Validate batch size constraints."""
         if not detections:
@@ -78,12 +158,12 @@ class BatchTranslationRequest(BaseModel):
             raise ValueError("Batch size exceeds maximum limit of 100")
         return detections
 
-@router.post("/translate")
+@router.post("/translate", dependencies=_TRANSLATION_RATE_LIMIT)
 async def translate_detection(
     request: TranslationRequest,
     fastapi_request: Request,
     background_tasks: BackgroundTasks
-) -> Dict[str, Any]:
+) -> ModelORJSONResponse:
     """
     Translate a single detection between formats with comprehensive validation.
 
@@ -93,33 +173,30 @@ async def translate_detection(
         background_tasks: Background tasks handler
 
     Returns:
-        Dict containing translation result and metadata
+        ModelORJSONResponse containing translation result and metadata
 
     Raises:
         HTTPException: For validation or translation errors
     """
-    start_time = time.time()
-    correlation_id = request.correlation_id or str(uuid.uuid4())
+    start_ns = time.perf_counter_ns()
+    correlation_id = request.correlation_id or token_hex(8)
 
     try:
         logger.info(
-            "Processing translation request",
-            extra={
-                "correlation_id": correlation_id,
-                "source_format": request.source_format,
-                "target_format": request.target_format
-            }
+            "Processing translation request cid=%s %s->%s",
+            correlation_id, request.source_format, request.target_format
         )
 
         # Increment request counter
-        TRANSLATION_COUNTER.labels(
-            source_format=request.source_format,
-            target_format=request.target_format,
-            status="started"
-        ).inc()
+        _COUNTER_CHILDREN[(request.source_format, request.target_format, "started")].inc()
 
-        # Perform translation
-        translation_result = await translation_service.translate(
+        # Perform translation, coalescing with concurrent requests when enabled
+        translate = (
+            translation_batcher.translate_detection
+            if translation_batcher is not None
+            else translation_service.translate
+        )
+        translation_result = await translate(
             detection_text=request.detection_text,
             source_format=request.source_format,
             target_format=request.target_format,
@@ -133,18 +210,15 @@ async def translate_detection(
         )
 
         # Record duration
-        duration = time.time() - start_time
-        TRANSLATION_DURATION.labels(
-            source_format=request.source_format,
-            target_format=request.target_format
-        ).observe(duration)
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
+        _DURATION_CHILDREN[(request.source_format, request.target_format)].observe(duration)
 
         # Prepare response
         response = {
             "correlation_id": correlation_id,
             "translated_text": translation_result.translated_text,
             "confidence_score": translation_result.confidence_score,
-            "validation_result": validation_result.dict(),
+            "validation_result": validation_result,
             "metadata": {
                 "duration_seconds": duration,
                 "source_format": request.source_format,
@@ -154,30 +228,18 @@ async def translate_detection(
         }
 
         # Update success metrics
-        TRANSLATION_COUNTER.labels(
-            source_format=request.source_format,
-            target_format=request.target_format,
-            status="success"
-        ).inc()
+        _COUNTER_CHILDREN[(request.source_format, request.target_format, "success")].inc()
 
-        return response
+        # Rendered directly by orjson, bypassing jsonable_encoder
+        return ModelORJSONResponse(content=response)
 
     except Exception as e:
         # Update error metrics
-        TRANSLATION_COUNTER.labels(
-            source_format=request.source_format,
-            target_format=request.target_format,
-            status="error"
-        ).inc()
+        _COUNTER_CHILDREN[(request.source_format, request.target_format, "error")].inc()
 
-        logger.error(
-            "Translation failed",
-            extra={
-                "correlation_id": correlation_id,
-                "error": str(e),
-                "source_format": request.source_format,
-                "target_format": request.target_format
-            }
+        logger.exception(
+            "Translation failed cid=%s src=%s tgt=%s",
+            correlation_id, request.source_format, request.target_format
         )
 
         raise HTTPException(
@@ -189,7 +251,7 @@ async def translate_detection(
             }
         )
 
-@router.post("/batch")
+@router.post("/batch", dependencies=_TRANSLATION_RATE_LIMIT)
 async def batch_translate(
     request: BatchTranslationRequest,
     fastapi_request: Request,
@@ -209,16 +271,13 @@ async def batch_translate(
     Raises:
         HTTPException: For validation or processing errors
     """
-    batch_id = request.batch_id or str(uuid.uuid4())
-    start_time = time.time()
+    batch_id = request.batch_id or token_hex(8)
+    start_ns = time.perf_counter_ns()
 
     try:
         logger.info(
-            "Processing batch translation request",
-            extra={
-                "batch_id": batch_id,
-                "batch_size": len(request.detections)
-            }
+            "Processing batch translation request batch_id=%s size=%d",
+            batch_id, len(request.detections)
         )
 
         # Update batch size metric
@@ -238,29 +297,28 @@ async def batch_translate(
         )
 
         # Prepare response
+        metadata = {
+            "duration_seconds": (time.perf_counter_ns() - start_ns) / 1e9,
+            "timestamp": int(time.time())
+        }
+        if request.batch_metadata:
+            metadata.update(request.batch_metadata)
+
         response = {
             "batch_id": batch_id,
             "total_count": len(request.detections),
             "success_count": batch_result.success_count,
             "failure_count": batch_result.failure_count,
-            "results": [result.dict() for result in batch_result.results],
-            "metadata": {
-                "duration_seconds": time.time() - start_time,
-                "timestamp": int(time.time()),
-                **request.batch_metadata if request.batch_metadata else {}
-            }
+            "results": [result.model_dump(mode="json") for result in batch_result.results],
+            "metadata": metadata
         }
 
         return response
 
     except Exception as e:
-        logger.error(
-            "Batch translation failed",
-            extra={
-                "batch_id": batch_id,
-                "error": str(e),
-                "batch_size": len(request.detections)
-            }
+        logger.exception(
+            "Batch translation failed batch_id=%s size=%d",
+            batch_id, len(request.detections)
         )
 
         raise HTTPException(
@@ -272,14 +330,122 @@ async def batch_translate(
             }
         )
 
+@router.post("/batch/stream", dependencies=_TRANSLATION_RATE_LIMIT)
+async def batch_translate_stream(
+    request: BatchTranslationRequest,
+    fastapi_request: Request
+) -> StreamingResponse:
+    """
+    Stream batch translation results as newline-delimited JSON.
+
+    One line is written per detection as soon as its translation completes, so
+    lines arrive in completion order; each carries the item's request index.
+
+    Args:
+        request: Batch translation request payload
+        fastapi_request: FastAPI request object
+
+    Returns:
+        StreamingResponse emitting application/x-ndjson lines
+    """
+    batch_id = request.batch_id or token_hex(8)
+
+    logger.info(
+        "Streaming batch translation request batch_id=%s size=%d",
+        batch_id, len(request.detections)
+    )
+    BATCH_SIZE_GAUGE.set(len(request.detections))
+
+    async def _lines() -> AsyncIterator[bytes]:
+        results = translation_service.batch_translate_iter(
+            detection_batch=[
+                {
+                    "detection_text": det.detection_text,
+                    "source_format": det.source_format,
+                    "target_format": det.target_format
+                }
+                for det in request.detections
+            ],
+            batch_options=request.batch_metadata
+        )
+        async for index, result in results:
+            if isinstance(result, Exception):
+                line = {"batch_id": batch_id, "index": index, "error": str(result)}
+            else:
+                line = {"batch_id": batch_id, "index": index, "result": result.model_dump(mode="json")}
+            yield orjson.dumps(line) + b"\n"
+
+    return StreamingResponse(_lines(), media_type="application/x-ndjson")
+
+@router.on_event("startup")
+async def start_translation_batcher() -> None:
+    """Create the micro-batching wrapper when batching is enabled."""
+    global translation_batcher
+    if TRANSLATE_BATCH_MAX > 1 and translation_batcher is None:
+        translation_batcher = CoalescingTranslator(
+            translation_service,
+            max_batch=TRANSLATE_BATCH_MAX,
+            max_wait_ms=TRANSLATE_BATCH_WAIT_MS
+        )
+
+@router.on_event("startup")
+async def warm_up_translation() -> None:
+    """Prepare the embeddings cache and prime the GenAI client before serving traffic."""
+    if not TRANSLATION_WARMUP:
+        return
+
+    start_ns = time.perf_counter_ns()
+    try:
+        Path(load_genai_config().embeddings_cache_dir).mkdir(parents=True, exist_ok=True)
+        await asyncio.wait_for(
+            translation_service.translate(
+                detection_text=WARMUP_DETECTION,
+                source_format='splunk',
+                target_format='splunk'
+            ),
+            timeout=TRANSLATION_WARMUP_TIMEOUT_S
+        )
+        logger.info(
+            "Translation warmup completed in %.3fs",
+            (time.perf_counter_ns() - start_ns) / 1e9
+        )
+    except asyncio.TimeoutError:
+        logger.warning(
+            "Translation warmup timed out after %.1fs", TRANSLATION_WARMUP_TIMEOUT_S
+        )
+    except Exception:
+        # Warmup is best effort; the service still starts
+        logger.warning("Translation warmup failed", exc_info=True)
+
+@router.on_event("shutdown")
+async def stop_translation_batcher() -> None:
+    """Stop the background micro-batching task."""
+    global translation_batcher
+    if translation_batcher is not None:
+        await translation_batcher.close()
+        translation_batcher = None
+
+@router.on_event("shutdown")
+def stop_validation_executor() -> None:
+    """Shut down the batch validation worker pool."""
+    shutdown_validation_executor()
+
 @router.get("/health")
-async def health_check() -> Dict[str, Any]:
+async def health_check() -> Response:
     """
     Enhanced health check endpoint with dependency status.
 
+    Healthy responses are pre-rendered and reused for HEALTH_CACHE_TTL_SECONDS.
+
     Returns:
-        Dict containing detailed service health status
+        Response containing detailed service health status
     """
+    global _health_cache
+
+    now = time.monotonic()
+    if _health_cache is not None and now - _health_cache[0] < HEALTH_CACHE_TTL_SECONDS:
+        return Response(content=_health_cache[1], media_type="application/json")
+
     try:
         # Check translation service
         translation_health = await translation_service.health_check()
@@ -287,7 +453,7 @@ async def health_check() -> Dict[str, Any]:
         # Check validation service
         validation_health = await validation_service.health_check()
 
-        return {
+        body = orjson.dumps({
             "status": "healthy",
             "timestamp": int(time.time()),
             "components": {
@@ -295,9 +461,11 @@ async def health_check() -> Dict[str, Any]:
                 "validation_service": validation_health
             },
             "metrics": {
-                "enabled": get_metrics_config().enabled
+                "enabled": _METRICS_CONFIG.enabled
             }
-        }
+        })
+        _health_cache = (now, body)
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
@@ -311,27 +479,21 @@ async def health_check() -> Dict[str, Any]:
         )
 
 @router.get("/metrics")
-async def metrics() -> Dict[str, Any]:
+async def metrics() -> Response:
     """
     Enhanced Prometheus metrics endpoint.
 
     Returns:
-        Dict containing detailed service metrics
+        Response containing all registered metrics in Prometheus text format
     """
     try:
-        metrics_config = get_metrics_config()
-        if not metrics_config.enabled:
+        if not _METRICS_CONFIG.enabled:
             raise HTTPException(
                 status_code=404,
                 detail="Metrics collection is disabled"
             )
 
-        return {
-            "translation_requests": TRANSLATION_COUNTER._value.get(),
-            "translation_duration": TRANSLATION_DURATION._sum.get(),
-            "current_batch_size": BATCH_SIZE_GAUGE._value.get(),
-            "timestamp": int(time.time())
-        }
+        return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
     except Exception as e:
         logger.error(f"Metrics collection failed: {str(e)}")
@@ -17,9 +17,9 @@ from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 
 # Internal imports with comprehensive configuration components
-from .genai import GenAIConfig
-from .logging import setup_logging
-from .metrics import MetricsConfig
+from .genai import GenAIConfig, load_config as load_genai_config
+from .logging import setup_logging, get_log_config
+from .metrics import MetricsConfig, get_metrics_config
 from .queue import QueueConfig
 
 # Global configuration settings with secure defaults
@@ -158,11 +158,20 @@ def validate_config(config: ServiceConfig) -> Tuple[bool, List[str]]:
     """
     return config.validate()
 
+def reset_config_cache() -> None:
+    """
+    Clears cached configuration loaders so the next call rebuilds them.
+    """
+    get_log_config.cache_clear()
+    get_metrics_config.cache_clear()
+    load_genai_config.cache_clear()
+
 # Export configuration components
 __all__ = [
     'ServiceConfig',
     'init_config',
     'validate_config',
+    'reset_config_cache',
     'ENV',
     'DEBUG',
     'CONFIG_VERSION'
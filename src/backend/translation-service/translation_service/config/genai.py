@@ -7,8 +7,9 @@ including model parameters, embeddings, format-specific settings, and validation
 Version: 1.0.0
 """
 
-from pydantic import BaseSettings, Field, validator  # version: 2.4.0
-from typing import Dict, List, Optional, Union  # version: 3.11
+from pydantic import BaseSettings, Field, PrivateAttr, validator  # version: 2.4.0
+import functools
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Union  # version: 3.11
 from pathlib import Path  # version: 3.11
 from os import getenv  # version: 3.11
 from ..utils.logger import get_logger  # Internal import
@@ -17,10 +18,10 @@ from ..utils.logger import get_logger  # Internal import
 logger = get_logger(__name__)
 
 # Supported detection formats
-SUPPORTED_FORMATS = [
+SUPPORTED_FORMATS = (
     'splunk', 'qradar', 'sigma', 'kql', 'paloalto', 
     'crowdstrike', 'yara', 'yaral'
-]
+)
 
 # Default confidence thresholds for each format
 DEFAULT_CONFIDENCE_THRESHOLDS = {
@@ -70,8 +71,8 @@ class GenAIConfig(BaseSettings):
         description="Cache directory for embeddings"
     )
     
-    supported_formats: List[str] = Field(
-        default_factory=lambda: SUPPORTED_FORMATS,
+    supported_formats: Tuple[str, ...] = Field(
+        default=SUPPORTED_FORMATS,
         description="List of supported detection formats"
     )
     
@@ -107,12 +108,19 @@ class GenAIConfig(BaseSettings):
         description="Format-specific configuration settings"
     )
 
+    # Membership index over supported_formats, built once at construction
+    _supported_formats_set: FrozenSet[str] = PrivateAttr(default_factory=frozenset)
+
     class Config:
         """Pydantic configuration settings"""
         env_prefix = "GENAI_"
         case_sensitive = True
         validate_assignment = True
         
+    def __init__(self, **data: Any) -> None:
+        super().__init__(**data)
+        self._supported_formats_set = frozenset(self.supported_formats)
+
     @validator("embeddings_cache_dir")
     def validate_cache_dir(cls, v: Path) -> Path:
         """Validate and create embeddings cache directory if needed."""
@@ -137,13 +145,13 @@ class GenAIConfig(BaseSettings):
         Raises:
             ValueError: If format is not supported
         """
-        if format_name not in self.supported_formats:
-            logger.error(f"Unsupported format requested: {format_name}")
+        if format_name not in self._supported_formats_set:
+            logger.error("Unsupported format requested: %s", format_name)
             raise ValueError(
                 f"Format '{format_name}' is not supported. "
                 f"Supported formats: {', '.join(self.supported_formats)}"
             )
-        logger.debug(f"Format validation successful: {format_name}")
+        logger.debug("Format validation successful: %s", format_name)
         return True
 
     def get_format_settings(self, format_name: str) -> Dict:
@@ -158,7 +166,7 @@ class GenAIConfig(BaseSettings):
         """
         self.validate_format(format_name)
         settings = self.format_specific_settings.get(format_name, {})
-        logger.debug(f"Retrieved settings for format {format_name}: {settings}")
+        logger.debug("Retrieved settings for format %s: %s", format_name, settings)
         return settings
 
     def update_confidence_threshold(self, format_name: str, threshold: float) -> None:
@@ -181,9 +189,13 @@ class GenAIConfig(BaseSettings):
             f"Updated confidence threshold for {format_name}: {threshold}"
         )
 
+@functools.lru_cache(maxsize=1)
 def load_config(env_prefix: str = "GENAI_") -> GenAIConfig:
     """
     Load and initialize GenAI configuration from environment variables.
+
+    The configuration is loaded once per process; call
+    ``load_config.cache_clear()`` to reload it.
     
     Args:
         env_prefix: Prefix for environment variables
@@ -7,11 +7,16 @@ structured JSON logging, trace ID support, and environment-specific settings.
 Version: 1.0.0
 """
 
+import atexit
+import dataclasses
+import functools
 import os
 import logging
+import queue
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
-import json_logging  # version: 1.5.0
+from logging.handlers import QueueListener
+from types import MappingProxyType
+from typing import Optional, Mapping, Any
 
 # Global configuration defaults from environment variables
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
@@ -22,53 +27,48 @@ ENABLE_ELK = os.getenv('ENABLE_ELK', 'true').lower() == 'true'
 ENABLE_TRACE_ID = os.getenv('ENABLE_TRACE_ID', 'true').lower() == 'true'
 LOG_ROTATION_SIZE = int(os.getenv('LOG_ROTATION_SIZE', '10485760'))  # 10MB default
 LOG_RETENTION_DAYS = int(os.getenv('LOG_RETENTION_DAYS', '30'))
+LOG_ENVIRONMENT = os.getenv('ENV', 'development')
 
-@dataclass
+# Accepted values for validation
+_VALID_LEVELS = frozenset(logging.getLevelNamesMapping())
+_VALID_FORMATS = frozenset({'json', 'text'})
+_VALID_ENVIRONMENTS = frozenset({'development', 'staging', 'production'})
+
+# Background listener that formats and writes records queued by request threads
+_queue_listener: Optional[QueueListener] = None
+
+def _stop_queue_listener() -> None:
+    """Drain queued records and stop the background log listener."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
+
+@dataclass(frozen=True, slots=True)
 class LogConfig:
     """Configuration class for comprehensive logging settings."""
     
-    level: str
-    format: str
-    file_enabled: bool
-    file_path: str
-    elk_enabled: bool
-    trace_id_enabled: bool
-    rotation_size: int
-    retention_days: int
-    environment: str
-
-    def __init__(
-        self,
-        level: Optional[str] = None,
-        format: Optional[str] = None,
-        file_enabled: Optional[bool] = None,
-        file_path: Optional[str] = None,
-        elk_enabled: Optional[bool] = None,
-        trace_id_enabled: Optional[bool] = None,
-        rotation_size: Optional[int] = None,
-        retention_days: Optional[int] = None,
-        environment: Optional[str] = None
-    ):
-        """Initialize logging configuration with comprehensive settings."""
-        self.level = level or LOG_LEVEL
-        self.format = format or LOG_FORMAT
-        self.file_enabled = file_enabled if file_enabled is not None else ENABLE_FILE_LOGGING
-        self.file_path = file_path or LOG_FILE_PATH
-        self.elk_enabled = elk_enabled if elk_enabled is not None else ENABLE_ELK
-        self.trace_id_enabled = trace_id_enabled if trace_id_enabled is not None else ENABLE_TRACE_ID
-        self.rotation_size = rotation_size or LOG_ROTATION_SIZE
-        self.retention_days = retention_days or LOG_RETENTION_DAYS
-        self.environment = environment or os.getenv('ENV', 'development')
+    level: str = LOG_LEVEL
+    format: str = LOG_FORMAT
+    file_enabled: bool = ENABLE_FILE_LOGGING
+    file_path: str = LOG_FILE_PATH
+    elk_enabled: bool = ENABLE_ELK
+    trace_id_enabled: bool = ENABLE_TRACE_ID
+    rotation_size: int = LOG_ROTATION_SIZE
+    retention_days: int = LOG_RETENTION_DAYS
+    environment: str = LOG_ENVIRONMENT
 
     def validate(self) -> bool:
         """Validate the comprehensive logging configuration settings."""
         try:
             # Validate log level
-            if self.level not in logging._nameToLevel:
+            if self.level not in _VALID_LEVELS:
                 raise ValueError(f"Invalid log level: {self.level}")
 
             # Validate log format
-            if self.format not in ['json', 'text']:
+            if self.format not in _VALID_FORMATS:
                 raise ValueError(f"Invalid log format: {self.format}")
 
             # Validate file logging settings
@@ -84,7 +84,7 @@ class LogConfig:
                 raise ValueError("Retention days must be positive")
 
             # Validate environment
-            if self.environment not in ['development', 'staging', 'production']:
+            if self.environment not in _VALID_ENVIRONMENTS:
                 raise ValueError(f"Invalid environment: {self.environment}")
 
             return True
@@ -98,14 +98,17 @@ def setup_logging(
     env: Optional[str] = None
 ) -> None:
     """Initialize and configure the logging system with comprehensive settings."""
-    
+    global _queue_listener
+
     # Create and validate config
-    config = LogConfig(level=log_level, environment=env)
+    config = LogConfig(level=log_level or LOG_LEVEL, environment=env or LOG_ENVIRONMENT)
     if not config.validate():
         raise ValueError("Invalid logging configuration")
 
-    # Initialize JSON logging for ELK Stack integration
+    # Initialize JSON logging for ELK Stack integration; json_logging is
+    # imported only here because it pulls in a large dependency tree
     if config.elk_enabled:
+        import json_logging  # version: 1.5.0
         json_logging.init_non_web(enable_json=True)
         json_logging.init_request_instrument()
 
@@ -113,19 +116,28 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(config.level)
     
-    # Clear existing handlers
+    # Clear existing handlers and any listener from a previous setup
     root_logger.handlers.clear()
+    _stop_queue_listener()
 
     # Configure console handler
     console_handler = logging.StreamHandler()
     if config.format == 'json':
-        formatter = json_logging.JSONLogFormatter()
-    else:
+        # orjson-backed formatter; imported here to avoid a cycle with utils.logger
+        from ..utils.logger import JsonFormatter
+        formatter = JsonFormatter(
+            default_fields={'service': app_name, 'environment': config.environment}
+        )
+    elif config.trace_id_enabled:
         formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(trace_id)s - %(message)s'
         )
+    else:
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # Configure file handler if enabled
     if config.file_enabled:
@@ -136,7 +148,18 @@ def setup_logging(
             backupCount=config.retention_days
         )
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Request threads only enqueue records; formatting and I/O run on the listener thread
+    from ..utils.logger import DeferredFormatQueueHandler, TraceIDFilter
+    log_queue = queue.SimpleQueue()
+    queue_handler = DeferredFormatQueueHandler(log_queue)
+    if config.trace_id_enabled:
+        # Records are formatted on another thread, so capture the trace ID before enqueueing
+        queue_handler.addFilter(TraceIDFilter())
+    root_logger.addHandler(queue_handler)
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
 
     # Configure environment-specific settings
     if config.environment == 'development':
@@ -157,17 +180,12 @@ def setup_logging(
         }
     )
 
-def get_log_config() -> Dict[str, Any]:
-    """Return the current logging configuration settings."""
-    config = LogConfig()
-    return {
-        "level": config.level,
-        "format": config.format,
-        "file_enabled": config.file_enabled,
-        "file_path": config.file_path,
-        "elk_enabled": config.elk_enabled,
-        "trace_id_enabled": config.trace_id_enabled,
-        "rotation_size": config.rotation_size,
-        "retention_days": config.retention_days,
-        "environment": config.environment
-    }
\ No newline at end of file
+@functools.lru_cache(maxsize=1)
+def get_log_config() -> Mapping[str, Any]:
+    """
+    Return the current logging configuration settings.
+
+    Built once per process as a read-only mapping; call
+    ``get_log_config.cache_clear()`` to rebuild it.
+    """
+    return MappingProxyType(dataclasses.asdict(LogConfig()))
@@ -8,10 +8,10 @@ collection endpoints, and operational parameters with security constraints.
 Version: 1.0.0
 """
 
+import functools
 import os
 import re
 from dataclasses import dataclass
-from typing import Optional
 
 # Constants for metrics configuration with secure defaults
 METRICS_PORT = int(os.getenv('METRICS_PORT', '9090'))
@@ -22,7 +22,10 @@ METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
 MIN_PORT = 1024  # Minimum non-privileged port
 MAX_PORT = 65535  # Maximum valid port number
 
-@dataclass
+# Characters outside this set are rejected in the metrics path
+_UNSAFE_PATH_RE = re.compile(r'[^a-zA-Z0-9/\-_]')
+
+@dataclass(frozen=True, slots=True)
 class MetricsConfig:
     """
     Configuration class for Prometheus metrics settings with validation and security constraints.
@@ -33,32 +36,17 @@ class MetricsConfig:
         enabled (bool): Flag to enable/disable metrics collection
     """
     
-    port: int
-    path: str
-    enabled: bool
+    port: int = METRICS_PORT
+    path: str = METRICS_PATH
+    enabled: bool = METRICS_ENABLED
     
-    def __init__(
-        self,
-        port: Optional[int] = None,
-        path: Optional[str] = None,
-        enabled: Optional[bool] = None
-    ) -> None:
+    def __post_init__(self) -> None:
         """
-        Initialize metrics configuration with validated default values.
-        
-        Args:
-            port: Optional port number for metrics server
-            path: Optional HTTP path for metrics endpoint
-            enabled: Optional flag to enable/disable metrics
+        Validate the configuration on construction.
             
         Raises:
             ValueError: If any configuration value is invalid
         """
-        self.port = port if port is not None else METRICS_PORT
-        self.path = path if path is not None else METRICS_PATH
-        self.enabled = enabled if enabled is not None else METRICS_ENABLED
-        
-        # Validate initial configuration
         self.validate()
     
     def validate(self) -> bool:
@@ -118,8 +106,7 @@ class MetricsConfig:
             raise ValueError("Metrics path must start with '/'")
             
         # Check for unsafe characters in path
-        unsafe_pattern = r'[^a-zA-Z0-9/\-_]'
-        if re.search(unsafe_pattern, self.path):
+        if _UNSAFE_PATH_RE.search(self.path):
             raise ValueError(
                 "Metrics path contains unsafe characters. "
                 "Only alphanumeric, hyphen, and underscore are allowed."
@@ -127,9 +114,13 @@ class MetricsConfig:
         
         return True
 
+@functools.lru_cache(maxsize=1)
 def get_metrics_config() -> MetricsConfig:
     """
     Returns the current metrics configuration settings with validation.
+
+    The configuration is built once per process; call
+    ``get_metrics_config.cache_clear()`` to reload it.
     
     Returns:
         MetricsConfig: Validated metrics configuration instance
@@ -12,9 +12,37 @@ External Dependencies:
 """
 
 import os
-import re
-from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
+import string
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple, Optional
+
+# Connection settings read from the environment once at import
+RABBITMQ_HOST = os.getenv('RABBITMQ_HOST', 'localhost')
+RABBITMQ_PORT = int(os.getenv('RABBITMQ_PORT', '5672'))
+RABBITMQ_USER = os.getenv('RABBITMQ_USER', 'guest')
+RABBITMQ_PASSWORD = os.getenv('RABBITMQ_PASSWORD', 'guest')
+RABBITMQ_VHOST = os.getenv('RABBITMQ_VHOST', '/')
+RABBITMQ_SSL_ENABLED = os.getenv('RABBITMQ_SSL_ENABLED', 'false').lower() == 'true'
+RABBITMQ_SSL_CERT_PATH = os.getenv('RABBITMQ_SSL_CERT_PATH', '')
+RABBITMQ_SSL_KEY_PATH = os.getenv('RABBITMQ_SSL_KEY_PATH', '')
+RABBITMQ_SSL_CA_PATH = os.getenv('RABBITMQ_SSL_CA_PATH', '')
+RABBITMQ_CLUSTER_NODES = tuple(
+    node.strip() for node in os.getenv('RABBITMQ_CLUSTER_NODES', '').split(',') if node.strip()
+)
+RABBITMQ_HA_ENABLED = os.getenv('RABBITMQ_HA_ENABLED', 'true').lower() == 'true'
+RABBITMQ_POOL_SIZE = int(os.getenv('RABBITMQ_POOL_SIZE', '10'))
+
+# Hostnames may only contain ASCII alphanumerics, dots and hyphens
+_HOST_ALLOWED_CHARSET = frozenset(string.ascii_letters + string.digits + '.-')
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
 
 # Queue name constants for different translation operations
 QUEUE_NAMES = {
@@ -23,8 +51,9 @@ QUEUE_NAMES = {
     'VALIDATION_QUEUE': 'validation_queue'
 }
 
-# Production-ready default queue options with optimized settings
-DEFAULT_QUEUE_OPTIONS = {
+# Production-ready default queue options with optimized settings; read-only and
+# shared by every QueueConfig, use QueueConfig.with_queue_options() to change them
+DEFAULT_QUEUE_OPTIONS: Mapping[str, Any] = MappingProxyType({
     'message_ttl': 3600000,  # 1 hour message TTL
     'durable': True,  # Survive broker restarts
     'auto_delete': False,  # Don't delete when consumers are gone
@@ -32,67 +61,79 @@ DEFAULT_QUEUE_OPTIONS = {
     'x-queue-mode': 'lazy',  # Optimize for high-volume queues
     'x-max-length': 100000,  # Maximum queue length
     'x-overflow': 'reject-publish'  # Reject new messages when queue is full
-}
+})
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QueueConfig:
     """
     Comprehensive RabbitMQ configuration class with support for clustering,
     SSL, and high availability settings.
+
+    Defaults come from the environment; instances are immutable.
     """
-    host: str
-    port: int
-    username: str
-    password: str
-    vhost: str
-    heartbeat: int
-    ssl_enabled: bool
-    ssl_cert_path: str
-    ssl_key_path: str
-    ssl_ca_path: str
-    connection_timeout: int
-    channel_prefetch: int
-    connection_attempts: int
-    queue_options: Dict
-    cluster_nodes: List[str]
-    ha_enabled: bool
-    pool_size: int
-
-    def __init__(self):
-        """
-        Initialize queue configuration with secure environment variables
-        and production-ready defaults.
+    host: str = RABBITMQ_HOST
+    port: int = RABBITMQ_PORT
+    username: str = RABBITMQ_USER
+    password: str = RABBITMQ_PASSWORD
+    vhost: str = RABBITMQ_VHOST
+    heartbeat: int = 60  # 60 seconds heartbeat
+
+    # SSL Configuration
+    ssl_enabled: bool = RABBITMQ_SSL_ENABLED
+    ssl_cert_path: str = RABBITMQ_SSL_CERT_PATH
+    ssl_key_path: str = RABBITMQ_SSL_KEY_PATH
+    ssl_ca_path: str = RABBITMQ_SSL_CA_PATH
+
+    # Connection Settings
+    connection_timeout: int = 30  # 30 seconds timeout
+    channel_prefetch: int = 100  # Process up to 100 messages per consumer
+    connection_attempts: int = 3  # Retry connection 3 times
+
+    # Queue Options
+    queue_options: Mapping[str, Any] = field(default_factory=lambda: DEFAULT_QUEUE_OPTIONS)
+
+    # Cluster Configuration
+    cluster_nodes: Tuple[str, ...] = RABBITMQ_CLUSTER_NODES
+
+    # High Availability Settings
+    ha_enabled: bool = RABBITMQ_HA_ENABLED
+
+    # Connection Pool
+    pool_size: int = RABBITMQ_POOL_SIZE
+
+    # Connection parameters derived from the settings above
+    _connection_params: Mapping[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Build the connection parameters once; frozen instances need object.__setattr__."""
+        object.__setattr__(self, '_connection_params', _freeze(self._build_connection_params()))
+
+    def is_valid(self) -> bool:
         """
-        self.host = os.getenv('RABBITMQ_HOST', 'localhost')
-        self.port = int(os.getenv('RABBITMQ_PORT', '5672'))
-        self.username = os.getenv('RABBITMQ_USER', 'guest')
-        self.password = os.getenv('RABBITMQ_PASSWORD', 'guest')
-        self.vhost = os.getenv('RABBITMQ_VHOST', '/')
-        self.heartbeat = 60  # 60 seconds heartbeat
-        
-        # SSL Configuration
-        self.ssl_enabled = os.getenv('RABBITMQ_SSL_ENABLED', 'false').lower() == 'true'
-        self.ssl_cert_path = os.getenv('RABBITMQ_SSL_CERT_PATH', '')
-        self.ssl_key_path = os.getenv('RABBITMQ_SSL_KEY_PATH', '')
-        self.ssl_ca_path = os.getenv('RABBITMQ_SSL_CA_PATH', '')
-        
-        # Connection Settings
-        self.connection_timeout = 30  # 30 seconds timeout
-        self.channel_prefetch = 100  # Process up to 100 messages per consumer
-        self.connection_attempts = 3  # Retry connection 3 times
-        
-        # Queue Options
-        self.queue_options = DEFAULT_QUEUE_OPTIONS.copy()
-        
-        # Cluster Configuration
-        cluster_nodes_str = os.getenv('RABBITMQ_CLUSTER_NODES', '')
-        self.cluster_nodes = [node.strip() for node in cluster_nodes_str.split(',') if node.strip()]
-        
-        # High Availability Settings
-        self.ha_enabled = os.getenv('RABBITMQ_HA_ENABLED', 'true').lower() == 'true'
+        Fast validity check that stops at the first failing rule.
+
+        Use validate() when the individual error messages are needed.
         
-        # Connection Pool
-        self.pool_size = int(os.getenv('RABBITMQ_POOL_SIZE', '10'))
+        Returns:
+            bool: True if the configuration passes every check
+        """
+        if not self.host or not _HOST_ALLOWED_CHARSET.issuperset(self.host):
+            return False
+        if not 1 <= self.port <= 65535:
+            return False
+        if not self.username or not self.password:
+            return False
+        if not self.vhost.startswith('/'):
+            return False
+        if not 0 <= self.heartbeat <= 600:
+            return False
+        if self.ssl_enabled:
+            ssl_paths = (self.ssl_cert_path, self.ssl_key_path, self.ssl_ca_path)
+            if not all(ssl_paths) or not all(os.path.exists(path) for path in ssl_paths):
+                return False
+        if self.connection_timeout <= 0 or self.channel_prefetch <= 0 or self.connection_attempts <= 0:
+            return False
+        return 1 <= self.pool_size <= 100
 
     def validate(self) -> Tuple[bool, List[str]]:
         """
@@ -106,7 +147,7 @@ class QueueConfig:
         # Host validation
         if not self.host:
             errors.append("Host cannot be empty")
-        elif not re.match(r'^[a-zA-Z0-9.-]+$', self.host):
+        elif not _HOST_ALLOWED_CHARSET.issuperset(self.host):
             errors.append("Invalid host format")
             
         # Port validation
@@ -147,13 +188,29 @@ class QueueConfig:
             
         return len(errors) == 0, errors
 
-    def get_connection_params(self) -> Dict:
+    def with_queue_options(self, **overrides: Any) -> 'QueueConfig':
+        """
+        Return a copy of this configuration with some queue options replaced.
+
+        Args:
+            **overrides: Queue options to set, e.g. ``**{'x-max-length': 50000}``
+
+        Returns:
+            QueueConfig: New configuration with a read-only merged options mapping
+        """
+        return replace(self, queue_options=MappingProxyType({**self.queue_options, **overrides}))
+
+    def get_connection_params(self) -> Mapping[str, Any]:
         """
         Returns production-ready connection parameters for RabbitMQ client.
         
         Returns:
-            Dict: Comprehensive connection parameters dictionary
+            Mapping[str, Any]: Read-only connection parameters built at initialization
         """
+        return self._connection_params
+
+    def _build_connection_params(self) -> Dict[str, Any]:
+        """Assemble the connection parameters dictionary from the current settings."""
         params = {
             'host': self.host,
             'port': self.port,
@@ -7,7 +7,8 @@ including Splunk SPL, SIGMA, KQL, QRadar, Palo Alto, Crowdstrike, YARA, and YARA
 Version: 1.0.0
 """
 
-from typing import Dict, Type, Optional, List
+from typing import Dict, FrozenSet, Tuple, Type, Optional, List, Union
+import functools
 import logging
 from .splunk import SplunkFormat  # version: 1.0.0
 from .sigma import SigmaFormatHandler  # version: 1.0.0 
@@ -24,8 +25,8 @@ FORMAT_HANDLERS: Dict[str, Type] = {
     'kql': KQLFormat
 }
 
-# List of all supported formats including those pending implementation
-SUPPORTED_FORMATS: List[str] = [
+# All supported formats including those pending implementation, in display order
+_SUPPORTED_FORMATS_ORDER: Tuple[str, ...] = (
     'splunk',
     'sigma', 
     'kql',
@@ -34,11 +35,30 @@ SUPPORTED_FORMATS: List[str] = [
     'crowdstrike',
     'yara',
     'yara-l'
-]
+)
+SUPPORTED_FORMATS: FrozenSet[str] = frozenset(_SUPPORTED_FORMATS_ORDER)
+_SUPPORTED_FORMATS_JOINED = ', '.join(_SUPPORTED_FORMATS_ORDER)
 
+# Methods every format handler must provide
+REQUIRED_HANDLER_METHODS = ('parse', 'generate')
+
+def _missing_handler_methods(handler_class: Type) -> List[str]:
+    """Return the required methods a handler class does not define."""
+    return [method for method in REQUIRED_HANDLER_METHODS if not hasattr(handler_class, method)]
+
+# Handler classes are checked once at import rather than on every lookup
+_MISSING_HANDLER_METHODS: Dict[str, List[str]] = {
+    name: _missing_handler_methods(handler_class)
+    for name, handler_class in FORMAT_HANDLERS.items()
+}
+
+@functools.lru_cache(maxsize=len(SUPPORTED_FORMATS))
 def get_format_handler(format_name: str) -> object:
     """
-    Factory function that creates and returns an instance of the appropriate format handler.
+    Factory function that returns the shared instance of the appropriate format handler.
+
+    Handlers are created once per format and reused; call
+    ``get_format_handler.cache_clear()`` to rebuild them.
     
     Args:
         format_name: Name of the detection format to handle
@@ -49,44 +69,39 @@ def get_format_handler(format_name: str) -> object:
     Raises:
         ValueError: If format is not supported or handler initialization fails
     """
+    # Validate format is supported
+    if format_name not in SUPPORTED_FORMATS:
+        raise ValueError(
+            f"Unsupported format: {format_name}. "
+            f"Supported formats: {_SUPPORTED_FORMATS_JOINED}"
+        )
+
+    # Get handler class
+    handler_class = FORMAT_HANDLERS.get(format_name)
+    if not handler_class:
+        raise ValueError(f"Handler not implemented for format: {format_name}")
+
+    # Validate handler has required methods
+    missing_methods = _MISSING_HANDLER_METHODS[format_name]
+    if missing_methods:
+        raise ValueError(
+            f"Handler missing required methods: {', '.join(missing_methods)}"
+        )
+
+    # Initialize handler; only constructor failures are wrapped
     try:
-        # Validate format is supported
-        if format_name not in SUPPORTED_FORMATS:
-            raise ValueError(
-                f"Unsupported format: {format_name}. "
-                f"Supported formats: {', '.join(SUPPORTED_FORMATS)}"
-            )
-            
-        # Get handler class
-        handler_class = FORMAT_HANDLERS.get(format_name)
-        if not handler_class:
-            raise ValueError(f"Handler not implemented for format: {format_name}")
-            
-        # Initialize handler
         handler = handler_class()
-        
-        # Validate handler has required methods
-        required_methods = ['parse', 'generate']
-        missing_methods = [
-            method for method in required_methods 
-            if not hasattr(handler, method)
-        ]
-        if missing_methods:
-            raise ValueError(
-                f"Handler missing required methods: {', '.join(missing_methods)}"
-            )
-            
-        logger.info(f"Initialized format handler for {format_name}")
-        return handler
-        
     except Exception as e:
-        logger.error(f"Error initializing format handler: {str(e)}")
-        raise ValueError(f"Failed to initialize format handler: {str(e)}")
+        logger.error("Error initializing format handler: %s", e)
+        raise ValueError(f"Failed to initialize format handler: {str(e)}") from e
+
+    logger.info("Initialized format handler for %s", format_name)
+    return handler
 
 def translate_detection(
     source_format: str,
     target_format: str,
-    detection_content: str
+    detection_content: Union[str, bytes, memoryview]
 ) -> str:
     """
     High-level function that orchestrates the translation of a detection between formats.
@@ -94,7 +109,8 @@ def translate_detection(
     Args:
         source_format: Source detection format
         target_format: Target detection format
-        detection_content: Detection content to translate
+        detection_content: Detection content to translate; raw UTF-8 bytes (e.g. a
+            queue message body) are accepted and decoded once after validation
         
     Returns:
         Translated detection content
@@ -108,18 +124,24 @@ def translate_detection(
         if not detection_content:
             raise ValueError("Empty detection content provided")
             
-        logger.info(
-            f"Starting detection translation",
-            extra={
-                'source_format': source_format,
-                'target_format': target_format,
-                'content_length': len(detection_content)
-            }
-        )
+        info_enabled = logger.isEnabledFor(logging.INFO)
+        if info_enabled:
+            logger.info(
+                "Starting detection translation",
+                extra={
+                    'source_format': source_format,
+                    'target_format': target_format,
+                    'content_length': len(detection_content)
+                }
+            )
         
         # Get format handlers
         source_handler = get_format_handler(source_format)
         target_handler = get_format_handler(target_format)
+
+        # Handlers parse text, so bytes payloads are decoded exactly once here
+        if not isinstance(detection_content, str):
+            detection_content = str(detection_content, 'utf-8')
         
         # Parse source detection to common model
         common_model = source_handler.parse(detection_content)
@@ -136,20 +158,21 @@ def translate_detection(
         if translated_content.startswith('// Error:'):
             raise ValueError(f"Target generation failed: {translated_content}")
             
-        logger.info(
-            f"Translation completed successfully",
-            extra={
-                'source_format': source_format,
-                'target_format': target_format,
-                'result_length': len(translated_content)
-            }
-        )
+        if info_enabled:
+            logger.info(
+                "Translation completed successfully",
+                extra={
+                    'source_format': source_format,
+                    'target_format': target_format,
+                    'result_length': len(translated_content)
+                }
+            )
         
         return translated_content
         
     except Exception as e:
         logger.error(
-            f"Translation failed",
+            "Translation failed",
             extra={
                 'error': str(e),
                 'source_format': source_format,
@@ -10,7 +10,9 @@ Version: 1.0.0
 
 import re  # version: 3.11+
 import json  # version: 3.11+
-from typing import Dict, Any, Optional, Tuple, List  # version: 3.11+
+from collections import OrderedDict  # version: 3.11+
+from dataclasses import dataclass  # version: 3.11+
+from typing import Dict, Any, Optional, Pattern, Tuple, List  # version: 3.11+
 
 from ...utils.logger import get_logger
 from ...genai.model import TranslationModel
@@ -34,12 +36,41 @@ CROWDSTRIKE_FIELDS: Dict[str, str] = {
     'host_name': 'HostName'
 }
 
-def validate_crowdstrike_syntax(detection_text: str) -> Tuple[bool, str, Dict[str, Any]]:
+# Crowdstrike field names, canonical and lower-cased, mapped back to common field names
+_CROWDSTRIKE_FIELDS_INV: Dict[str, str] = {
+    **{v.lower(): k for k, v in CROWDSTRIKE_FIELDS.items()},
+    **{v: k for k, v in CROWDSTRIKE_FIELDS.items()}
+}
+
+# Validation results kept per handler, keyed by detection text
+VALIDATION_CACHE_SIZE = 1024
+
+# Maps parentheses to spaces so boolean operators next to them still count as words
+_PAREN_TO_SPACE = str.maketrans('()', '  ')
+
+# Pre-compiled field patterns
+EVENTS_FIELD_PATTERN: Pattern[str] = re.compile(r'(\w+):\s*([^,\n]+)')
+TITLE_FIELD_PATTERN: Pattern[str] = re.compile(r'title:\s*".+"')
+DESCRIPTION_FIELD_PATTERN: Pattern[str] = re.compile(r'description:\s*".+"')
+SNAKE_CASE_PATTERN: Pattern[str] = re.compile(r'\b[a-z]+_[a-z]+\b')
+
+@dataclass(frozen=True)
+class _ParsedSections:
+    """Raw section bodies of a detection; None when a section wasn't found."""
+    metadata: Optional[str] = None
+    events: Optional[str] = None
+    condition: Optional[str] = None
+
+def validate_crowdstrike_syntax(
+    detection_text: str,
+    sections: Optional[_ParsedSections] = None
+) -> Tuple[bool, str, Dict[str, Any]]:
     """
     Validates Crowdstrike detection syntax with comprehensive error reporting.
 
     Args:
         detection_text: Detection rule to validate
+        sections: Sections already extracted from detection_text, if available
 
     Returns:
         Tuple containing:
@@ -58,28 +89,31 @@ def validate_crowdstrike_syntax(detection_text: str) -> Tuple[bool, str, Dict[st
     try:
         # Check for required sections
         required_sections = ['metadata', 'events', 'condition']
+        lowered_text = detection_text.lower()
         for section in required_sections:
-            if section not in detection_text.lower():
+            if section not in lowered_text:
                 validation_report['errors'].append(f"Missing required section: {section}")
                 validation_report['is_valid'] = False
 
+        # Locate metadata, events and condition sections unless the caller already has
+        if sections is None:
+            sections = _extract_sections(detection_text)
+
         # Validate metadata section
-        metadata_match = re.search(r'metadata:\s*{([^}]+)}', detection_text)
-        if metadata_match:
-            metadata_text = metadata_match.group(1)
-            if not re.search(r'title:\s*".+"', metadata_text):
+        metadata_text = sections.metadata
+        if metadata_text:
+            if not TITLE_FIELD_PATTERN.search(metadata_text):
                 validation_report['errors'].append("Missing required metadata field: title")
-            if not re.search(r'description:\s*".+"', metadata_text):
+            if not DESCRIPTION_FIELD_PATTERN.search(metadata_text):
                 validation_report['warnings'].append("Missing recommended metadata field: description")
         else:
             validation_report['errors'].append("Invalid metadata section format")
 
         # Validate events section
-        events_match = re.search(r'events:\s*{([^}]+)}', detection_text)
-        if events_match:
-            events_text = events_match.group(1)
+        events_text = sections.events
+        if events_text:
             # Check field names
-            field_matches = re.finditer(r'(\w+):\s*([^,\n]+)', events_text)
+            field_matches = EVENTS_FIELD_PATTERN.finditer(events_text)
             for match in field_matches:
                 field_name = match.group(1)
                 if field_name not in CROWDSTRIKE_FIELDS.values():
@@ -89,9 +123,8 @@ def validate_crowdstrike_syntax(detection_text: str) -> Tuple[bool, str, Dict[st
             validation_report['errors'].append("Invalid events section format")
 
         # Validate condition section
-        condition_match = re.search(r'condition:\s*(.+)', detection_text)
-        if condition_match:
-            condition_text = condition_match.group(1)
+        condition_text = sections.condition
+        if condition_text:
             # Check for valid operators
             valid_operators = ['and', 'or', 'not']
             for op in valid_operators:
@@ -124,13 +157,129 @@ def normalize_field_names(field_name: str, reverse: bool = False) -> str:
     Returns:
         Normalized field name
     """
-    if reverse:
-        # Convert common format to Crowdstrike format
-        return CROWDSTRIKE_FIELDS.get(field_name.lower(), field_name)
-    else:
-        # Convert Crowdstrike format to common format
-        inverse_map = {v.lower(): k for k, v in CROWDSTRIKE_FIELDS.items()}
-        return inverse_map.get(field_name.lower(), field_name)
+    # Canonical spellings hit the map directly; only other casings pay for lower()
+    field_map = CROWDSTRIKE_FIELDS if reverse else _CROWDSTRIKE_FIELDS_INV
+    normalized = field_map.get(field_name)
+    if normalized is None:
+        normalized = field_map.get(field_name.lower(), field_name)
+    return normalized
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    """Return the index of the first non-whitespace character at or after pos."""
+    end = len(text)
+    while pos < end and text[pos].isspace():
+        pos += 1
+    return pos
+
+def _is_word(text: str) -> bool:
+    """Check that text is a non-empty run of word characters (regex \\w+)."""
+    return bool(text) and text.replace('_', 'a').isalnum()
+
+def _section_body(detection_text: str, name: str) -> Optional[str]:
+    """Return the body of the first non-empty ``name: { ... }`` section, or None."""
+    marker = f'{name}:'
+    start = detection_text.find(marker)
+    while start != -1:
+        brace = _skip_whitespace(detection_text, start + len(marker))
+        if brace < len(detection_text) and detection_text[brace] == '{':
+            end = detection_text.find('}', brace + 1)
+            if end == -1:
+                return None
+            if end > brace + 1:
+                return detection_text[brace + 1:end]
+        start = detection_text.find(marker, start + 1)
+    return None
+
+def _condition_text(detection_text: str) -> str:
+    """Return the first line of the condition section, or '' if there is none."""
+    marker = 'condition:'
+    start = detection_text.find(marker)
+    while start != -1:
+        value_start = _skip_whitespace(detection_text, start + len(marker))
+        value_end = detection_text.find('\n', value_start)
+        if value_end == -1:
+            value_end = len(detection_text)
+        if value_end > value_start:
+            return detection_text[value_start:value_end]
+        start = detection_text.find(marker, start + 1)
+    return ''
+
+def _extract_sections(detection_text: str) -> _ParsedSections:
+    """Locate the metadata, events and condition sections; shared by parsing and validation."""
+    return _ParsedSections(
+        metadata=_section_body(detection_text, 'metadata'),
+        events=_section_body(detection_text, 'events'),
+        condition=_condition_text(detection_text) or None
+    )
+
+def _metadata_fields(metadata_text: str) -> Dict[str, str]:
+    """Collect ``key: "value"`` pairs; quoted values may contain commas and newlines."""
+    metadata: Dict[str, str] = {}
+    pos = 0
+    while True:
+        colon = metadata_text.find(':', pos)
+        if colon == -1:
+            return metadata
+        pos = colon + 1
+        key_start = colon
+        while key_start > 0 and _is_word(metadata_text[key_start - 1]):
+            key_start -= 1
+        quote = _skip_whitespace(metadata_text, pos)
+        if key_start == colon or quote >= len(metadata_text) or metadata_text[quote] != '"':
+            continue
+        closing = metadata_text.find('"', quote + 1)
+        if closing == -1:
+            return metadata
+        if closing > quote + 1:
+            metadata[metadata_text[key_start:colon]] = metadata_text[quote + 1:closing]
+            pos = closing + 1
+
+def _event_fields(events_text: str) -> Dict[str, str]:
+    """
+    Collect ``Field: value`` pairs separated by commas or newlines, in common field names.
+
+    A field that ends its line with no value takes the first segment of the next
+    non-blank line, as in ``ProcessName:\n    cmd.exe``.
+    """
+    events: Dict[str, str] = {}
+    pending_key: Optional[str] = None
+    for line in events_text.split('\n'):
+        segments = line.split(',')
+        if pending_key is not None:
+            if not line.strip():
+                continue
+            value = segments[0].strip()
+            if value:
+                events[normalize_field_names(pending_key)] = value
+            pending_key = None
+            segments = segments[1:]
+        for index, segment in enumerate(segments):
+            key, separator, value = segment.partition(':')
+            key = key.strip()
+            value = value.strip()
+            if not separator or not _is_word(key):
+                continue
+            if value:
+                events[normalize_field_names(key)] = value
+            elif index == len(segments) - 1:
+                pending_key = key
+    return events
+
+def _parse_sections(sections: _ParsedSections) -> Tuple[Dict[str, str], Dict[str, str], str]:
+    """
+    Turn extracted section bodies into common-format fields.
+
+    Args:
+        sections: Sections located by _extract_sections
+
+    Returns:
+        Tuple of (metadata fields, event fields, condition text)
+    """
+    return (
+        _metadata_fields(sections.metadata) if sections.metadata else {},
+        _event_fields(sections.events) if sections.events else {},
+        sections.condition or ''
+    )
 
 class CrowdstrikeFormat:
     """
@@ -151,7 +300,7 @@ class CrowdstrikeFormat:
             'metadata_fields': ['title', 'description', 'author'],
             'max_condition_depth': 5
         }
-        self._cache: Dict[str, Any] = {}
+        self._cache: 'OrderedDict[str, Tuple[bool, str, Dict[str, Any], _ParsedSections]]' = OrderedDict()
 
         logger.info("Initialized CrowdstrikeFormat handler")
 
@@ -171,31 +320,13 @@ class CrowdstrikeFormat:
         logger.debug("Parsing Crowdstrike detection")
 
         # Validate detection syntax
-        is_valid, error_msg, validation_report = validate_crowdstrike_syntax(detection_text)
+        is_valid, error_msg, validation_report, sections = self._validate_syntax(detection_text)
         if not is_valid:
             raise ValueError(f"Invalid Crowdstrike detection: {error_msg}")
 
         try:
-            # Parse metadata section
-            metadata_match = re.search(r'metadata:\s*{([^}]+)}', detection_text)
-            metadata = {}
-            if metadata_match:
-                metadata_text = metadata_match.group(1)
-                for match in re.finditer(r'(\w+):\s*"([^"]+)"', metadata_text):
-                    metadata[match.group(1)] = match.group(2)
-
-            # Parse events section
-            events_match = re.search(r'events:\s*{([^}]+)}', detection_text)
-            events = {}
-            if events_match:
-                events_text = events_match.group(1)
-                for match in re.finditer(r'(\w+):\s*([^,\n]+)', events_text):
-                    field_name = normalize_field_names(match.group(1))
-                    events[field_name] = match.group(2).strip()
-
-            # Parse condition section
-            condition_match = re.search(r'condition:\s*(.+)', detection_text)
-            condition = condition_match.group(1) if condition_match else ''
+            # Parse the metadata, events and condition sections validation already located
+            metadata, events, condition = _parse_sections(sections)
 
             # Construct common format
             parsed_detection = {
@@ -214,12 +345,13 @@ class CrowdstrikeFormat:
             logger.error(f"Error parsing Crowdstrike detection: {str(e)}")
             raise ValueError(f"Parsing failed: {str(e)}")
 
-    def generate(self, detection_data: Dict[str, Any]) -> str:
+    def generate(self, detection_data: Dict[str, Any], strict: bool = False) -> str:
         """
         Generate Crowdstrike detection from common format.
 
         Args:
             detection_data: Detection data in common format
+            strict: Also run the full syntax validator over the generated text
 
         Returns:
             Crowdstrike detection string
@@ -234,21 +366,29 @@ class CrowdstrikeFormat:
             if not all(k in detection_data for k in ['metadata', 'detection']):
                 raise ValueError("Missing required sections in detection data")
 
+            # Check the inputs the rendered sections depend on
+            metadata = detection_data['metadata']
+            detection = detection_data['detection']
+            condition = detection.get('condition', '')
+            if not metadata.get('title'):
+                raise ValueError("Missing required metadata field: title")
+            if not detection.get('fields'):
+                raise ValueError("Missing detection fields")
+            if not isinstance(condition, str) or not condition.strip():
+                raise ValueError("Missing detection condition")
+
             # Generate metadata section
-            metadata_items = []
-            for key, value in detection_data['metadata'].items():
-                metadata_items.append(f'    {key}: "{value}"')
+            metadata_items = [f'    {key}: "{value}"' for key, value in metadata.items()]
             metadata_section = "metadata: {\n" + ",\n".join(metadata_items) + "\n}"
 
             # Generate events section
-            events_items = []
-            for field, value in detection_data['detection']['fields'].items():
-                crowdstrike_field = normalize_field_names(field, reverse=True)
-                events_items.append(f'    {crowdstrike_field}: {value}')
+            events_items = [
+                f'    {normalize_field_names(field, reverse=True)}: {value}'
+                for field, value in detection['fields'].items()
+            ]
             events_section = "events: {\n" + ",\n".join(events_items) + "\n}"
 
             # Generate condition section
-            condition = detection_data['detection'].get('condition', '')
             condition_section = f"condition: {condition}"
 
             # Combine sections
@@ -258,10 +398,11 @@ class CrowdstrikeFormat:
                 condition_section
             ])
 
-            # Validate generated detection
-            is_valid, error_msg, _ = validate_crowdstrike_syntax(crowdstrike_detection)
-            if not is_valid:
-                raise ValueError(f"Generated invalid detection: {error_msg}")
+            # Full regex validation of the output is opt-in; the input checks above cover it
+            if strict:
+                is_valid, error_msg, _, _ = self._validate_syntax(crowdstrike_detection)
+                if not is_valid:
+                    raise ValueError(f"Generated invalid detection: {error_msg}")
 
             logger.info("Successfully generated Crowdstrike detection")
             return crowdstrike_detection
@@ -283,18 +424,18 @@ class CrowdstrikeFormat:
         logger.debug("Validating Crowdstrike detection")
 
         try:
-            # Perform syntax validation
-            is_valid, error_msg, validation_report = validate_crowdstrike_syntax(detection_text)
+            # Perform syntax validation; its sections are shared by the analysis helpers
+            is_valid, error_msg, validation_report, sections = self._validate_syntax(detection_text)
 
             # Add performance impact analysis
-            validation_report['performance_impact'] = self._analyze_performance_impact(detection_text)
+            validation_report['performance_impact'] = self._analyze_performance_impact(sections)
 
             # Add best practices check
             validation_report['best_practices'] = self._check_best_practices(detection_text)
 
             # Generate optimization suggestions
             validation_report['optimization_suggestions'] = self._generate_optimization_suggestions(
-                detection_text,
+                sections,
                 validation_report
             )
 
@@ -314,13 +455,45 @@ class CrowdstrikeFormat:
                 'performance_impact': 'unknown'
             }
 
-    def _analyze_performance_impact(self, detection_text: str) -> str:
+    def _validate_syntax(
+        self,
+        detection_text: str
+    ) -> Tuple[bool, str, Dict[str, Any], _ParsedSections]:
+        """
+        Run validate_crowdstrike_syntax through a bounded per-handler LRU cache.
+
+        The cached report is never handed out directly; callers get a copy they may extend.
+
+        Args:
+            detection_text: Detection rule to validate
+
+        Returns:
+            The validate_crowdstrike_syntax tuple followed by the extracted sections
+        """
+        cached = self._cache.get(detection_text)
+        if cached is None:
+            sections = _extract_sections(detection_text)
+            cached = (*validate_crowdstrike_syntax(detection_text, sections), sections)
+            self._cache[detection_text] = cached
+            if len(self._cache) > VALIDATION_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(detection_text)
+
+        is_valid, error_msg, validation_report, sections = cached
+        report_copy = {
+            key: value.copy() if isinstance(value, (dict, list)) else value
+            for key, value in validation_report.items()
+        }
+        return is_valid, error_msg, report_copy, sections
+
+    def _analyze_performance_impact(self, sections: _ParsedSections) -> str:
         """Analyze potential performance impact of the detection."""
         # Count condition complexity
-        condition_match = re.search(r'condition:\s*(.+)', detection_text)
-        if condition_match:
-            condition = condition_match.group(1)
-            operator_count = len(re.findall(r'\b(and|or)\b', condition))
+        condition = sections.condition
+        if condition:
+            words = f' {condition.lower().translate(_PAREN_TO_SPACE)} '
+            operator_count = words.count(' and ') + words.count(' or ')
             if operator_count > 5:
                 return 'high'
             elif operator_count > 3:
@@ -332,20 +505,20 @@ class CrowdstrikeFormat:
         best_practices = []
         
         # Check metadata completeness
-        if not re.search(r'author:', detection_text):
+        if 'author:' not in detection_text:
             best_practices.append("Add author information to metadata")
-        if not re.search(r'description:', detection_text):
+        if 'description:' not in detection_text:
             best_practices.append("Add detailed description to metadata")
 
-        # Check field naming conventions
-        if re.search(r'\b[a-z]+_[a-z]+\b', detection_text):
+        # Check field naming conventions; snake_case is impossible without an underscore
+        if '_' in detection_text and SNAKE_CASE_PATTERN.search(detection_text):
             best_practices.append("Use CamelCase for field names instead of snake_case")
 
         return best_practices
 
     def _generate_optimization_suggestions(
         self,
-        detection_text: str,
+        sections: _ParsedSections,
         validation_report: Dict[str, Any]
     ) -> List[str]:
         """Generate optimization suggestions based on validation results."""
@@ -356,10 +529,9 @@ class CrowdstrikeFormat:
             suggestions.append("Consider simplifying condition logic to improve performance")
 
         # Check field usage
-        events_match = re.search(r'events:\s*{([^}]+)}', detection_text)
-        if events_match:
-            events_text = events_match.group(1)
-            if len(events_text.split('\n')) > 10:
+        events_text = sections.events
+        if events_text:
+            if events_text.count('\n') + 1 > 10:
                 suggestions.append("Consider grouping related fields to reduce complexity")
 
         return suggestions
\ No newline at end of file
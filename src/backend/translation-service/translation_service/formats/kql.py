@@ -9,7 +9,7 @@ Version: 1.0.0
 """
 
 import re  # version: 3.11+
-from typing import Dict, List, Optional, Any, Pattern, Match  # version: 3.11+
+from typing import Dict, List, Optional, Any, Pattern, Match, Set, Tuple  # version: 3.11+
 from ..utils.logger import get_logger
 
 # Global constants for KQL syntax elements
@@ -18,11 +18,16 @@ KQL_OPERATORS: List[str] = [
     'distinct', 'top', 'sort', 'count', 'take', 'limit', 'order by',
     'mv-expand', 'make-series'
 ]
+_KQL_OPERATORS_SET = frozenset(KQL_OPERATORS)
 
 # Compiled regex patterns for performance optimization
 KQL_TABLE_PATTERN: Pattern[str] = re.compile(r'^[a-zA-Z][a-zA-Z0-9_]{0,63}$')
 KQL_FIELD_PATTERN: Pattern[str] = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]{0,63}$')
 KQL_TIME_PATTERN: Pattern[str] = re.compile(r'ago(\d+[hdm])|startofday|endofday|now()')
+KQL_OPERATOR_PATTERN: Pattern[str] = re.compile(
+    r'\b(' + '|'.join(map(re.escape, KQL_OPERATORS)) + r')\b',
+    re.IGNORECASE
+)
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -38,15 +43,36 @@ class KQLFormat:
         # Initialize pattern cache for performance
         self.cached_patterns: Dict[str, Any] = {}
         
-        # Pre-compile common regex patterns
-        self.operator_pattern = re.compile(
-            r'\b(' + '|'.join(map(re.escape, KQL_OPERATORS)) + r')\b',
-            re.IGNORECASE
-        )
+        # Shared pre-compiled regex patterns
+        self.operator_pattern = KQL_OPERATOR_PATTERN
         self.table_pattern = KQL_TABLE_PATTERN
         self.field_pattern = KQL_FIELD_PATTERN
         self.time_pattern = KQL_TIME_PATTERN
 
+    def _match_operator(self, line: str) -> Optional[Tuple[str, int]]:
+        """
+        Find the first KQL operator in a line.
+
+        Lines usually start with ``| <operator>``, so the leading token is checked
+        against the operator set before falling back to the regex search.
+
+        Args:
+            line: Query line to inspect
+
+        Returns:
+            Tuple of (lower-cased operator, index just past it), or None
+        """
+        rest = line.lstrip('| \t')
+        first_token = rest.split(None, 1)[0] if rest else ''
+        operator = first_token.lower()
+        if operator in _KQL_OPERATORS_SET:
+            return operator, len(line) - len(rest) + len(first_token)
+
+        operator_match = self.operator_pattern.search(line)
+        if operator_match:
+            return operator_match.group(0).lower(), operator_match.end()
+        return None
+
     def parse(self, detection_content: str, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Parse a KQL detection rule into the common detection model with validation.
@@ -74,12 +100,12 @@ class KQLFormat:
                 "metadata": {},
                 "pattern_matches": [],
                 "conditions": [],
-                "fields": set()
+                "fields": {}  # dict as an insertion-ordered set
             }
 
             # Split into lines and remove comments
-            lines = [line.strip() for line in detection_content.split('\n')
-                    if line.strip() and not line.strip().startswith("//")]
+            lines = [line for line in map(str.strip, detection_content.split('\n'))
+                    if line and not line.startswith("//")]
 
             # Parse table reference
             table_match = self.table_pattern.match(lines[0].split()[0])
@@ -87,41 +113,44 @@ class KQLFormat:
                 raise ValueError(f"Invalid table name: {lines[0].split()[0]}")
             detection_model["source_table"] = table_match.group(0)
 
-            # Parse time range
-            time_specs = []
-            for line in lines:
-                time_matches = self.time_pattern.finditer(line)
-                time_specs.extend(match.group(0) for match in time_matches)
-            if time_specs:
-                detection_model["time_range"] = time_specs[0]
+            # Parse time range; the first match in the comment-free body, found in one search
+            time_match = self.time_pattern.search('\n'.join(lines))
+            if time_match:
+                detection_model["time_range"] = time_match.group(0)
 
             # Parse operators and conditions
             current_operator = None
             for line in lines[1:]:
-                operator_match = self.operator_pattern.search(line)
+                operator_match = self._match_operator(line)
                 if operator_match:
-                    current_operator = operator_match.group(0).lower()
-                    operator_content = line[operator_match.end():].strip()
+                    current_operator, operator_end = operator_match
+                    operator_content = line[operator_end:].strip()
                     
-                    # Extract fields
-                    fields = self.field_pattern.finditer(operator_content)
-                    detection_model["fields"].update(
-                        match.group(0) for match in fields
-                    )
-
                     # Build condition
                     if current_operator == "where":
+                        # Predicates can't be split on commas; only a bare field name counts
+                        field_match = self.field_pattern.match(operator_content)
+                        if field_match:
+                            detection_model["fields"][field_match.group(0)] = None
                         detection_model["conditions"].append({
                             "operator": current_operator,
                             "expression": operator_content
                         })
-                    elif current_operator in ("project", "extend"):
+                        continue
+
+                    # Other operators take comma-separated field lists
+                    field_list = operator_content.split(",")
+                    detection_model["fields"].update(
+                        (field, None) for field in map(str.strip, field_list)
+                        if self.field_pattern.match(field)
+                    )
+                    if current_operator in ("project", "extend"):
                         detection_model["pattern_matches"].append({
                             "type": current_operator,
-                            "fields": operator_content.split(",")
+                            "fields": field_list
                         })
 
-            # Convert fields set to list
+            # Convert fields to a list in first-seen order
             detection_model["fields"] = list(detection_model["fields"])
 
             logger.info("Successfully parsed KQL detection", 
@@ -167,16 +196,18 @@ class KQLFormat:
                 query_parts.append(f"| where TimeGenerated >= {detection_model['time_range']}")
 
             # Add conditions
-            for condition in detection_model.get("conditions", []):
-                if condition["operator"] == "where":
-                    query_parts.append(f"| where {condition['expression']}")
+            query_parts.extend(
+                f"| where {condition['expression']}"
+                for condition in detection_model.get("conditions", [])
+                if condition["operator"] == "where"
+            )
 
             # Add pattern matches
-            for pattern in detection_model.get("pattern_matches", []):
-                if pattern["type"] == "project":
-                    query_parts.append(f"| project {', '.join(pattern['fields'])}")
-                elif pattern["type"] == "extend":
-                    query_parts.append(f"| extend {', '.join(pattern['fields'])}")
+            query_parts.extend(
+                f"| {pattern['type']} {', '.join(pattern['fields'])}"
+                for pattern in detection_model.get("pattern_matches", [])
+                if pattern["type"] in ("project", "extend")
+            )
 
             # Build final query with proper formatting
             kql_query = "\n".join(query_parts)
@@ -224,7 +255,7 @@ class KQLFormat:
                 return False
 
             # Track operator order
-            seen_operators = []
+            seen_operators: Set[str] = set()
             
             # Validate each line
             for line in lines[1:]:
@@ -233,10 +264,10 @@ class KQLFormat:
                     continue
 
                 # Check operator syntax
-                operator_match = self.operator_pattern.search(line)
+                operator_match = self._match_operator(line)
                 if operator_match:
-                    operator = operator_match.group(0).lower()
-                    seen_operators.append(operator)
+                    operator = operator_match[0]
+                    seen_operators.add(operator)
 
                     # Validate operator order
                     if operator == "project" and "extend" in seen_operators:
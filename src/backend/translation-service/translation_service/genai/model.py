@@ -232,6 +232,28 @@ class TranslationModel:
             )
             raise RuntimeError(f"Translation failed: {str(e)}")
 
+    async def batch_translate_detections(
+        self,
+        requests: List[Dict[str, Any]]
+    ) -> List[Any]:
+        """
+        Translate multiple detections concurrently.
+
+        Each item is still its own translate_detection call and model request;
+        this only gives callers such as CoalescingTranslator a batch interface.
+
+        Args:
+            requests: List of translate_detection keyword argument dicts
+
+        Returns:
+            List of translation results in request order; failed items are
+            returned as the raised exception
+        """
+        return await asyncio.gather(
+            *(self.translate_detection(**request) for request in requests),
+            return_exceptions=True
+        )
+
     async def calculate_confidence(
         self,
         source_text: str,
@@ -12,7 +12,7 @@ Version: 1.0.0
 from typing import List, Dict, Optional, Any
 
 # Internal imports with version tracking
-from .translation import TranslationService  # Internal service class
+from .translation import TranslationService, CoalescingTranslator  # Internal service classes
 from .validation import (  # Internal validation components
     ValidationService,
     ValidationStatus,
@@ -50,6 +50,7 @@ FORMAT_VERSION_MAP: Dict[str, str] = {
 __all__ = [
     # Core services
     'TranslationService',
+    'CoalescingTranslator',
     'ValidationService',
     
     # Validation components
@@ -9,13 +9,17 @@ Version: 1.0.0
 """
 
 import asyncio  # version: 3.11+
-from typing import Dict, List, Optional, Any
-from pydantic import BaseModel  # version: 2.4.2
-from prometheus_client import Counter, Histogram  # version: 0.17.1
+from typing import AsyncIterator, Dict, List, Optional, Any, Set, Tuple, Union
+import orjson  # version: 3.9.10
+import blake3  # version: 0.4.1
+from pydantic import BaseModel, ConfigDict  # version: 2.4.2
 import redis  # version: 5.0.1
+import threading
 import time
+from collections import OrderedDict
 from functools import wraps
 
+from ..config.metrics import METRICS_ENABLED
 from ..genai.model import TranslationModel
 from ..services.validation import ValidationService
 from ..utils.logger import get_logger
@@ -24,28 +28,53 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 # Global constants
-SUPPORTED_FORMATS = ['splunk', 'qradar', 'sigma', 'kql', 'paloalto', 'crowdstrike', 'yara', 'yaral']
+SUPPORTED_FORMATS = frozenset({'splunk', 'qradar', 'sigma', 'kql', 'paloalto', 'crowdstrike', 'yara', 'yaral'})
 MIN_CONFIDENCE_SCORE = 0.85
 MAX_RETRIES = 3
 CACHE_TTL = 3600  # 1 hour
+LOCAL_CACHE_SIZE = 1024  # In-process LRU entries in front of Redis
 BATCH_SIZE = 50
+COALESCE_MAX_WAIT_MS = 10
 METRICS_PREFIX = 'translation_service'
 
-# Initialize metrics
-TRANSLATION_REQUESTS = Counter(
-    f'{METRICS_PREFIX}_requests_total',
-    'Total number of translation requests',
-    ['source_format', 'target_format', 'status']
-)
-
-TRANSLATION_LATENCY = Histogram(
-    f'{METRICS_PREFIX}_latency_seconds',
-    'Translation request duration in seconds',
-    ['source_format', 'target_format']
-)
+# Metrics collectors, created on first use to keep prometheus_client off the import path
+# Guards creation so concurrent first use can't register a collector twice
+_TRANSLATION_REQUESTS = None
+_TRANSLATION_LATENCY = None
+_METRICS_LOCK = threading.Lock()
+
+def _get_counter():
+    """Return the translation request counter, creating it on first use."""
+    global _TRANSLATION_REQUESTS
+    if _TRANSLATION_REQUESTS is None:
+        with _METRICS_LOCK:
+            if _TRANSLATION_REQUESTS is None:
+                from prometheus_client import Counter  # version: 0.17.1
+                _TRANSLATION_REQUESTS = Counter(
+                    f'{METRICS_PREFIX}_requests_total',
+                    'Total number of translation requests',
+                    ['source_format', 'target_format', 'status']
+                )
+    return _TRANSLATION_REQUESTS
+
+def _get_histogram():
+    """Return the translation latency histogram, creating it on first use."""
+    global _TRANSLATION_LATENCY
+    if _TRANSLATION_LATENCY is None:
+        with _METRICS_LOCK:
+            if _TRANSLATION_LATENCY is None:
+                from prometheus_client import Histogram  # version: 0.17.1
+                _TRANSLATION_LATENCY = Histogram(
+                    f'{METRICS_PREFIX}_latency_seconds',
+                    'Translation request duration in seconds',
+                    ['source_format', 'target_format']
+                )
+    return _TRANSLATION_LATENCY
 
 class TranslationResult(BaseModel):
     """Model for translation results with comprehensive metadata."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     translated_text: str
     confidence_score: float
     source_format: str
@@ -53,8 +82,13 @@ class TranslationResult(BaseModel):
     validation_result: Dict[str, Any]
     metadata: Dict[str, Any]
 
+# Exact key set of a cache entry written by the current schema
+_RESULT_FIELDS = frozenset(TranslationResult.model_fields)
+
 class BatchTranslationResult(BaseModel):
     """Model for batch translation results."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     results: List[TranslationResult]
     success_count: int
     failure_count: int
@@ -65,12 +99,18 @@ def metrics_collector(func):
     """Decorator for collecting comprehensive metrics on translation operations."""
     @wraps(func)
     async def wrapper(self, *args, **kwargs):
+        # With metrics disabled prometheus_client is never imported
+        if not self._metrics_enabled:
+            return await func(self, *args, **kwargs)
+
         start_time = time.time()
         source_format = kwargs.get('source_format', 'unknown')
         target_format = kwargs.get('target_format', 'unknown')
         
+        requests_counter = _get_counter()
+
         try:
-            TRANSLATION_REQUESTS.labels(
+            requests_counter.labels(
                 source_format=source_format,
                 target_format=target_format,
                 status='started'
@@ -78,14 +118,14 @@ def metrics_collector(func):
             
             result = await func(self, *args, **kwargs)
             
-            TRANSLATION_REQUESTS.labels(
+            requests_counter.labels(
                 source_format=source_format,
                 target_format=target_format,
                 status='success'
             ).inc()
             
             duration = time.time() - start_time
-            TRANSLATION_LATENCY.labels(
+            _get_histogram().labels(
                 source_format=source_format,
                 target_format=target_format
             ).observe(duration)
@@ -93,7 +133,7 @@ def metrics_collector(func):
             return result
             
         except Exception as e:
-            TRANSLATION_REQUESTS.labels(
+            requests_counter.labels(
                 source_format=source_format,
                 target_format=target_format,
                 status='error'
@@ -111,6 +151,158 @@ def metrics_collector(func):
             raise
     return wrapper
 
+def _cache_key(req_hash: str, source_format: str, target_format: str) -> str:
+    """Build the translation cache key from a pre-computed detection hash."""
+    return f"translation:{source_format}:{target_format}:{req_hash}"
+
+class CoalescingTranslator:
+    """
+    Drop-in wrapper for a translation model that groups concurrent single
+    translate_detection calls into one batch_translate_detections call per
+    batching window.
+
+    Whether a batch becomes a single backend request depends on the wrapped
+    model; TranslationModel and TranslationService still translate each item
+    separately, so wrapping them only adds the batching wait.
+    """
+
+    def __init__(
+        self,
+        translation_model: TranslationModel,
+        max_batch: int = BATCH_SIZE,
+        max_wait_ms: float = COALESCE_MAX_WAIT_MS
+    ):
+        """
+        Initialize the coalescing translator.
+
+        Args:
+            translation_model: Model exposing batch_translate_detections
+            max_batch: Maximum number of requests passed per batch call
+            max_wait_ms: Maximum time a request waits for a batch to fill
+        """
+        self._translation_model = translation_model
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000
+        self._queue: asyncio.Queue[Tuple[Dict[str, Any], asyncio.Future]] = asyncio.Queue()
+        self._runner_task: Optional[asyncio.Task] = None
+        self._dispatch_tasks: Set[asyncio.Task] = set()
+        # Every caller future not yet resolved, whether queued, batching or dispatched
+        self._pending: Set[asyncio.Future] = set()
+
+    async def translate_detection(
+        self,
+        detection_text: str,
+        source_format: str,
+        target_format: str,
+        options: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Queue a translation and wait for its result from the next batch.
+
+        Args:
+            detection_text: Source detection text
+            source_format: Source detection format
+            target_format: Target detection format
+            options: Optional translation parameters
+
+        Returns:
+            Dict containing translation results and metadata
+
+        Raises:
+            RuntimeError: If the translator is closed before the request completes
+        """
+        if self._runner_task is None or self._runner_task.done():
+            self._runner_task = asyncio.create_task(self._runner())
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        await self._queue.put((
+            {
+                'detection_text': detection_text,
+                'source_format': source_format,
+                'target_format': target_format,
+                'options': options
+            },
+            future
+        ))
+        return await future
+
+    async def close(self) -> None:
+        """Stop batching and fail every request that has not completed yet."""
+        closed_error = RuntimeError("CoalescingTranslator closed")
+        for future in list(self._pending):
+            if not future.done():
+                future.set_exception(closed_error)
+
+        tasks = list(self._dispatch_tasks)
+        if self._runner_task is not None:
+            tasks.append(self._runner_task)
+            self._runner_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Drop queued entries; their futures were failed above
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    async def _runner(self) -> None:
+        """Drain queued requests into batches and dispatch them."""
+        while True:
+            batch = [await self._queue.get()]
+            self._drain_into(batch)
+
+            # Give concurrent callers up to max_wait to join a partial batch
+            if len(batch) < self._max_batch:
+                await asyncio.sleep(self._max_wait)
+                self._drain_into(batch)
+
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatch_tasks.add(task)
+            task.add_done_callback(self._dispatch_tasks.discard)
+
+    def _drain_into(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """Move queued requests into the batch without waiting."""
+        while len(batch) < self._max_batch:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+    async def _dispatch(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """Make one batch call and resolve every per-request future."""
+        try:
+            results = await self._translation_model.batch_translate_detections(
+                [request for request, _ in batch]
+            )
+        except BaseException as e:
+            # Includes cancellation; callers must never be left waiting
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(
+                        e if isinstance(e, Exception) else RuntimeError("Batch dispatch cancelled")
+                    )
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+        if len(results) != len(batch):
+            mismatch = RuntimeError(
+                f"Batch returned {len(results)} results for {len(batch)} requests"
+            )
+            for _, future in batch[len(results):]:
+                if not future.done():
+                    future.set_exception(mismatch)
+
 class TranslationService:
     """
     Enterprise-grade service for translating security detections between formats
@@ -134,10 +326,13 @@ class TranslationService:
         self._translation_model = translation_model
         self._cache_client = cache_client
         self._validation_service = validation_service
+        self._metrics_enabled = METRICS_ENABLED
+        # Per-process LRU of recent results, checked before the shared Redis cache
+        self._local_cache: 'OrderedDict[str, TranslationResult]' = OrderedDict()
         
         logger.info(
             "Initialized TranslationService",
-            extra={'supported_formats': SUPPORTED_FORMATS}
+            extra={'supported_formats': sorted(SUPPORTED_FORMATS)}
         )
 
     @metrics_collector
@@ -164,22 +359,30 @@ class TranslationService:
             ValueError: For invalid inputs
             RuntimeError: For translation failures
         """
+        if source_format not in SUPPORTED_FORMATS or target_format not in SUPPORTED_FORMATS:
+            unsupported = source_format if source_format not in SUPPORTED_FORMATS else target_format
+            raise ValueError(f"Unsupported format: {unsupported}")
+
         if not detection_text:
             raise ValueError("Empty detection text provided")
-            
-        if source_format not in SUPPORTED_FORMATS or target_format not in SUPPORTED_FORMATS:
-            raise ValueError(f"Unsupported format(s): {source_format} -> {target_format}")
 
-        # Generate cache key
-        cache_key = f"translation:{source_format}:{target_format}:{hash(detection_text)}"
+        # Hash detection text once; reused for the cache key and log correlation
+        req_hash = blake3.blake3(detection_text.encode()).hexdigest(16)
+        cache_key = _cache_key(req_hash, source_format, target_format)
+
+        # Cached results were validated when stored; return without another validation pass
+        cached_result = await self._get_cached_translation(cache_key)
+        if cached_result:
+            logger.info("Cache hit for translation")
+            if self._metrics_enabled:
+                _get_counter().labels(
+                    source_format=source_format,
+                    target_format=target_format,
+                    status='cache_hit'
+                ).inc()
+            return cached_result
 
         try:
-            # Check cache first
-            cached_result = await self._get_cached_translation(cache_key)
-            if cached_result:
-                logger.info("Cache hit for translation")
-                return cached_result
-
             # Perform translation
             translation_result = await self._translation_model.translate_detection(
                 detection_text=detection_text,
@@ -201,7 +404,7 @@ class TranslationService:
                 confidence_score=translation_result['confidence_score'],
                 source_format=source_format,
                 target_format=target_format,
-                validation_result=validation_result.dict(),
+                validation_result=validation_result.model_dump(),
                 metadata={
                     'timestamp': time.time(),
                     'model_version': translation_result['metadata']['model'],
@@ -220,6 +423,7 @@ class TranslationService:
                 "Translation failed",
                 extra={
                     'error': str(e),
+                    'req_hash': req_hash[:8],
                     'source_format': source_format,
                     'target_format': target_format
                 }
@@ -246,33 +450,33 @@ class TranslationService:
         success_count = 0
         failure_count = 0
 
+        # Bound in-flight translations without waiting on slice boundaries
+        semaphore = asyncio.Semaphore(BATCH_SIZE)
+
+        async def _bounded_translate(item: Dict[str, str]) -> TranslationResult:
+            async with semaphore:
+                return await self.translate(
+                    detection_text=item['detection_text'],
+                    source_format=item['source_format'],
+                    target_format=item['target_format'],
+                    options=batch_options
+                )
+
         try:
-            # Process in optimal batch sizes
-            for i in range(0, len(detection_batch), BATCH_SIZE):
-                batch_slice = detection_batch[i:i + BATCH_SIZE]
-                
-                # Create translation tasks
-                tasks = [
-                    self.translate(
-                        detection_text=item['detection_text'],
-                        source_format=item['source_format'],
-                        target_format=item['target_format'],
-                        options=batch_options
-                    )
-                    for item in batch_slice
-                ]
-                
-                # Execute batch in parallel
-                batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Process results
-                for result in batch_results:
-                    if isinstance(result, Exception):
-                        failure_count += 1
-                        logger.error(f"Batch translation error: {str(result)}")
-                    else:
-                        success_count += 1
-                        results.append(result)
+            # Execute batch in parallel
+            batch_results = await asyncio.gather(
+                *(_bounded_translate(item) for item in detection_batch),
+                return_exceptions=True
+            )
+
+            # Process results
+            for result in batch_results:
+                if isinstance(result, Exception):
+                    failure_count += 1
+                    logger.error(f"Batch translation error: {str(result)}")
+                else:
+                    success_count += 1
+                    results.append(result)
 
             return BatchTranslationResult(
                 results=results,
@@ -289,12 +493,95 @@ class TranslationService:
             logger.error(f"Batch translation failed: {str(e)}")
             raise RuntimeError(f"Batch translation failed: {str(e)}")
 
+    async def batch_translate_detections(
+        self,
+        requests: List[Dict[str, Any]]
+    ) -> List[Any]:
+        """
+        Translate multiple detections, keeping one result slot per request.
+
+        Lets the service sit behind a CoalescingTranslator the same way a model does.
+
+        Args:
+            requests: List of translate keyword argument dicts
+
+        Returns:
+            List of TranslationResult in request order; failed items are
+            returned as the raised exception
+        """
+        return await asyncio.gather(
+            *(self.translate(**request) for request in requests),
+            return_exceptions=True
+        )
+
+    async def batch_translate_iter(
+        self,
+        detection_batch: List[Dict[str, str]],
+        batch_options: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Tuple[int, Union[TranslationResult, Exception]]]:
+        """
+        Stream batch translation results as each translation completes.
+
+        Args:
+            detection_batch: List of detections to translate
+            batch_options: Optional batch processing parameters
+
+        Yields:
+            (index, result) pairs in completion order, where index is the item's
+            position in detection_batch and result is its TranslationResult or
+            the raised exception
+        """
+        async def _indexed(index: int, item: Dict[str, str]) -> Tuple[int, Any]:
+            try:
+                return index, await self.translate(
+                    detection_text=item['detection_text'],
+                    source_format=item['source_format'],
+                    target_format=item['target_format'],
+                    options=batch_options
+                )
+            except Exception as e:
+                logger.error(f"Batch translation error: {str(e)}")
+                return index, e
+
+        tasks = [
+            asyncio.create_task(_indexed(index, item))
+            for index, item in enumerate(detection_batch)
+        ]
+
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            # Consumer stopped early; don't leave translations running
+            for task in tasks:
+                task.cancel()
+
+    def _remember(self, cache_key: str, result: TranslationResult) -> None:
+        """Store a result in the in-process LRU, evicting the oldest entry when full."""
+        self._local_cache[cache_key] = result
+        self._local_cache.move_to_end(cache_key)
+        if len(self._local_cache) > LOCAL_CACHE_SIZE:
+            self._local_cache.popitem(last=False)
+
     async def _get_cached_translation(self, cache_key: str) -> Optional[TranslationResult]:
-        """Retrieve cached translation result."""
+        """Retrieve cached translation result from the local LRU, then Redis."""
+        result = self._local_cache.get(cache_key)
+        if result is not None:
+            self._local_cache.move_to_end(cache_key)
+            return result
+
         try:
             cached_data = await self._cache_client.get(cache_key)
             if cached_data:
-                return TranslationResult.parse_raw(cached_data)
+                payload = orjson.loads(cached_data)
+                if isinstance(payload, dict) and payload.keys() == _RESULT_FIELDS:
+                    # Same shape _cache_translation writes from validated models
+                    result = TranslationResult.model_construct(**payload)
+                else:
+                    # Another deployment or an older schema; an invalid entry is a miss
+                    result = TranslationResult.model_validate(payload)
+                self._remember(cache_key, result)
+                return result
             return None
         except Exception as e:
             logger.error(f"Cache retrieval error: {str(e)}")
@@ -302,11 +589,12 @@ class TranslationService:
 
     async def _cache_translation(self, cache_key: str, result: TranslationResult) -> None:
         """Cache successful translation result."""
+        self._remember(cache_key, result)
         try:
             await self._cache_client.setex(
                 cache_key,
                 CACHE_TTL,
-                result.json()
+                orjson.dumps(result.model_dump())
             )
         except Exception as e:
             logger.error(f"Cache storage error: {str(e)}")
\ No newline at end of file
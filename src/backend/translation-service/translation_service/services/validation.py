@@ -7,7 +7,10 @@ with detailed validation reporting, confidence scoring, and error feedback.
 Version: 1.0.0
 """
 
+import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Counter
 from dataclasses import dataclass, field
 from pydantic import BaseModel  # version: 2.4.2
@@ -29,6 +32,20 @@ VALIDATION_THRESHOLDS = {
     'aggregation_accuracy_score': 0.94
 }
 
+# Worker pool size for batch validation
+VALIDATION_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Batch validation pool shared by every ValidationService; created on first use
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Precompiled syntax patterns for format-specific validation. A clause only
+# counts as unfinished when nothing follows before the next pipe or the end of
+# the search, so values and field lists may continue on the next line.
+_SPLUNK_CLAUSE_END = r'[ \t]*(?=\n\s*\||\s*\Z)'
+_SPLUNK_INCOMPLETE_RE = re.compile(r'\|[ \t]*where[ \t]+\w+[ \t]*=' + _SPLUNK_CLAUSE_END)
+_SPLUNK_TRAILING_COMMA_RE = re.compile(r',' + _SPLUNK_CLAUSE_END)
+
 # Error categories for detailed reporting
 ERROR_CATEGORIES = {
     'SYNTAX': 'Syntax and format errors',
@@ -39,6 +56,29 @@ ERROR_CATEGORIES = {
     'AGGREGATION': 'Data aggregation and grouping issues'
 }
 
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared batch validation pool, creating it if needed."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=VALIDATION_MAX_WORKERS,
+                thread_name_prefix='validation'
+            )
+        return _executor
+
+def shutdown_validation_executor() -> None:
+    """
+    Shut down the shared batch validation pool.
+
+    Called from the application's shutdown hook; a later batch creates a new pool.
+    """
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
 class ValidationResult(BaseModel):
     """Enhanced validation result model with comprehensive scoring and feedback."""
     
@@ -89,6 +129,11 @@ class ValidationService:
             ) for dimension in self._thresholds.keys()
         }
 
+    @property
+    def _executor(self) -> ThreadPoolExecutor:
+        """Shared module-level pool used for batch validation."""
+        return _get_executor()
+
     @track_validation
     def validate_detection(
         self,
@@ -176,15 +221,16 @@ class ValidationService:
         Returns:
             List of ValidationResult objects
         """
+        # Fan out to the worker pool; results are collected in submission order
+        futures = [
+            self._executor.submit(self._validate_batch_item, detection, batch_options)
+            for detection in detections
+        ]
+
         results = []
-        for detection in detections:
+        for detection, future in zip(detections, futures):
             try:
-                result = self.validate_detection(
-                    detection['content'],
-                    detection['format'],
-                    batch_options
-                )
-                results.append(result)
+                results.append(future.result())
             except Exception as e:
                 logger.error(f"Batch validation error: {str(e)}", extra={
                     'detection_id': detection.get('id'),
@@ -199,6 +245,18 @@ class ValidationService:
 
         return results
 
+    def _validate_batch_item(
+        self,
+        detection: Dict[str, Any],
+        batch_options: Optional[Dict[str, Any]]
+    ) -> ValidationResult:
+        """Validate a single batch entry on a worker thread."""
+        return self.validate_detection(
+            detection['content'],
+            detection['format'],
+            batch_options
+        )
+
     def _calculate_dimension_scores(self, result: ValidationResult) -> None:
         """Calculate detailed scores for each validation dimension."""
         for dimension, threshold in self._thresholds.items():
@@ -252,8 +310,10 @@ class ValidationService:
     # Format-specific validation handlers
     def _validate_splunk(self, detection: str, result: ValidationResult, options: Optional[Dict[str, Any]]) -> None:
         """Validate Splunk SPL detection rules."""
-        # Implementation details for Splunk validation
-        pass
+        if _SPLUNK_INCOMPLETE_RE.search(detection):
+            result.errors['SYNTAX'].append("Incomplete statement: where clause is missing a value")
+        if _SPLUNK_TRAILING_COMMA_RE.search(detection):
+            result.errors['SYNTAX'].append("Incomplete statement: trailing comma in field list")
 
     def _validate_sigma(self, detection: str, result: ValidationResult, options: Optional[Dict[str, Any]]) -> None:
         """Validate SIGMA detection rules."""
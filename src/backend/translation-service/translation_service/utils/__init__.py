@@ -20,8 +20,7 @@ from .metrics import (
     MetricsManager,
     track_translation as track_translation_request,
     reset_metrics as track_translation_error,
-    export_metrics as track_translation_duration,
-    aggregate_metrics as record_validation_score
+    export_metrics as track_translation_duration
 )
 
 # Package version
@@ -39,8 +38,7 @@ __all__ = [
     "MetricsManager",
     "track_translation_request",
     "track_translation_error", 
-    "track_translation_duration",
-    "record_validation_score"
+    "track_translation_duration"
 ]
 
 # Initialize default logger for the package
@@ -11,12 +11,15 @@ This module provides comprehensive logging functionality with support for:
 Version: 1.0.0
 """
 
+import copy
+import dataclasses
 import logging
-import json_logging  # version: 1.5.0
+from logging.handlers import QueueHandler
+import re
+import time
 from typing import Optional, Dict, Any, Tuple
 from contextvars import ContextVar
-import uuid
-import json
+import orjson  # version: 3.9.10
 from ..config.logging import LogConfig
 
 # Global context variable for trace ID tracking
@@ -28,6 +31,63 @@ DEFAULT_FORMAT: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 # Performance optimization constants
 LOG_BUFFER_SIZE: int = 8192
 MAX_FIELD_LENGTH: int = 32768
+TRUNCATION_SUFFIX: str = '...[truncated]'
+
+# Canonical UUID text, either dashed or compact 32-digit hex
+_TRACE_ID_RE = re.compile(
+    r'\A[0-9a-fA-F]{8}(-?)[0-9a-fA-F]{4}\1[0-9a-fA-F]{4}\1[0-9a-fA-F]{4}\1[0-9a-fA-F]{12}\Z'
+)
+
+# Client-supplied trace IDs are propagated as-is when short and header/log safe
+MAX_TRACE_ID_LENGTH: int = 128
+_INBOUND_TRACE_ID_RE = re.compile(rf'\A[A-Za-z0-9._:=-]{{1,{MAX_TRACE_ID_LENGTH}}}\Z')
+
+# Extra-field keys whose values are never written to logs: exact names first,
+# then any key with a sensitive word as one of its _/-/. separated segments
+_SENSITIVE_KEYS = frozenset({
+    'password', 'api_key', 'apikey', 'token', 'secret', 'authorization', 'bearer'
+})
+_SENSITIVE_KEY_RE = re.compile(
+    r'(?i)(?:^|[_.-])(?:password|passwd|secret|token|api[_-]?key|apikey|authorization|bearer|credentials?)(?:$|[_.-])'
+)
+# Values that carry a credential rather than merely mention one
+_SENSITIVE_VALUE_RE = re.compile(
+    r'(?i)\bbearer\s+\S|\b(?:password|passwd|secret|token|api[_-]?key)\s*[=:]\s*\S'
+)
+REDACTED_VALUE: str = '[REDACTED]'
+
+# Attributes every LogRecord carries; anything else on a record came from `extra=`
+_LOG_RECORD_ATTRS = frozenset(
+    logging.LogRecord('', logging.NOTSET, '', 0, '', (), None).__dict__
+) | frozenset({'message', 'asctime', 'taskName', 'trace_id', 'extra_fields'})
+
+# orjson options for log emission: UTC 'Z' timestamps and non-string dict keys
+_ORJSON_OPTIONS: int = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+def _json_dumps(payload: Dict[str, Any]) -> str:
+    """Serialize a log payload to a JSON string, stringifying unknown types."""
+    return orjson.dumps(payload, default=str, option=_ORJSON_OPTIONS).decode('utf-8')
+
+class DeferredFormatQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records unformatted.
+
+    The stdlib prepare() merges args and the traceback into msg on the calling
+    thread and clears exc_info; this keeps both so the listener's formatter
+    does the work and can emit exceptions as their own field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Copy so handlers later in the chain see the record unchanged
+        return copy.copy(record)
+
+class TraceIDFilter(logging.Filter):
+    """Stamp records with the current request's trace ID while still in the request context."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, 'trace_id'):
+            record.trace_id = TRACE_ID_CTX_VAR.get()
+        return True
 
 class JsonFormatter(logging.Formatter):
     """Custom JSON formatter with enhanced validation and error handling."""
@@ -45,12 +105,19 @@ class JsonFormatter(logging.Formatter):
             max_field_length: Maximum length for any field value
         """
         super().__init__()
-        self._default_fields = default_fields or {}
+        # Private copy so callers can't mutate defaults after construction
+        self._default_fields = dict(default_fields or {})
+        # Constant fields serialized once; spliced into each record as raw JSON members
+        self._default_fields_json = orjson.dumps(
+            self._default_fields, default=str, option=_ORJSON_OPTIONS
+        )[1:-1]
         self._max_field_length = max_field_length or MAX_FIELD_LENGTH
+        # (whole second, ISO prefix) pair, swapped as one tuple so threads never see a torn update
+        self._timestamp_cache: Tuple[int, str] = (-1, '')
         self._field_validators = {
             'level': lambda x: x in logging._nameToLevel,
             'timestamp': lambda x: isinstance(x, (int, float, str)),
-            'trace_id': lambda x: isinstance(x, str) and len(x) <= 36
+            'trace_id': lambda x: isinstance(x, str) and len(x) <= MAX_TRACE_ID_LENGTH
         }
 
     def format(self, record: logging.LogRecord) -> str:
@@ -64,51 +131,110 @@ class JsonFormatter(logging.Formatter):
             JSON formatted log string
         """
         try:
-            # Create base log dictionary
+            # Create base log dictionary; default fields are added pre-serialized
             log_dict = {
-                'timestamp': self.formatTime(record),
+                'timestamp': self._format_timestamp(record.created),
                 'level': record.levelname,
                 'name': record.name,
-                'message': record.getMessage()
+                'message': self._truncate(record.getMessage())
             }
 
-            # Add trace ID if present
-            trace_id = get_trace_id()
+            # Add trace ID if present; records handed across threads carry their own
+            trace_id = getattr(record, 'trace_id', None) or TRACE_ID_CTX_VAR.get()
             if trace_id:
                 log_dict['trace_id'] = trace_id
 
-            # Add default fields
-            log_dict.update(self._default_fields)
-
-            # Add extra fields from record
+            # Add flat `extra=` keys, then the explicit extra_fields mapping
+            for key, value in record.__dict__.items():
+                if key not in _LOG_RECORD_ATTRS:
+                    self._add_field(log_dict, key, value)
             if hasattr(record, 'extra_fields'):
                 for key, value in record.extra_fields.items():
-                    valid, error = self.validate_field(key, value)
-                    if valid:
-                        log_dict[key] = value
-                    else:
-                        log_dict[f'invalid_{key}'] = error
+                    self._add_field(log_dict, key, value)
 
             # Handle exception info if present
             if record.exc_info:
-                log_dict['exception'] = self.formatException(record.exc_info)
-
-            # Validate and truncate all fields
-            for key, value in list(log_dict.items()):
-                if isinstance(value, str) and len(value) > self._max_field_length:
-                    log_dict[key] = value[:self._max_field_length] + '...[truncated]'
+                log_dict['exception'] = self._truncate(self.formatException(record.exc_info))
 
-            return json.dumps(log_dict)
+            return self._render(log_dict)
         except Exception as e:
             # Fallback formatting in case of errors
-            return json.dumps({
-                'timestamp': self.formatTime(record),
+            return _json_dumps({
+                'timestamp': self._format_timestamp(record.created),
                 'level': 'ERROR',
                 'name': 'logger',
                 'message': f'Error formatting log: {str(e)}',
                 'original_message': str(record.msg)
             })
 
+    def _add_field(self, log_dict: Dict[str, Any], key: Any, value: Any) -> None:
+        """
+        Add one extra field to the payload after redaction, truncation and validation.
+
+        Args:
+            log_dict: Payload being built for the record
+            key: Extra field name
+            value: Extra field value
+        """
+        if isinstance(key, str) and (
+            key.lower() in _SENSITIVE_KEYS or _SENSITIVE_KEY_RE.search(key)
+        ):
+            log_dict[key] = REDACTED_VALUE
+            return
+        if type(value) is str and _SENSITIVE_VALUE_RE.search(value):
+            log_dict[key] = REDACTED_VALUE
+            return
+        if type(value) is str:
+            value = self._truncate(value)
+        valid, error = self.validate_field(key, value)
+        if valid:
+            log_dict[key] = value
+        else:
+            log_dict[f'invalid_{key}'] = error
+
+    def _render(self, log_dict: Dict[str, Any]) -> str:
+        """
+        Serialize per-record fields and append the pre-encoded default fields.
+
+        Record fields take precedence; if one shares a name with a default
+        field the payload is merged and serialized in full instead.
+
+        Args:
+            log_dict: Fields that vary per record
+
+        Returns:
+            JSON formatted log string
+        """
+        if not self._default_fields_json:
+            return _json_dumps(log_dict)
+        if not self._default_fields.keys().isdisjoint(log_dict):
+            return _json_dumps({**self._default_fields, **log_dict})
+        payload = orjson.dumps(log_dict, default=str, option=_ORJSON_OPTIONS)
+        return (payload[:-1] + b',' + self._default_fields_json + b'}').decode('utf-8')
+
+    def _truncate(self, value: str) -> str:
+        """Clip a string so that, with the truncation marker, it fits the field limit."""
+        if len(value) <= self._max_field_length:
+            return value
+        return value[:self._max_field_length - len(TRUNCATION_SUFFIX)] + TRUNCATION_SUFFIX
+
+    def _format_timestamp(self, created: float) -> str:
+        """
+        Render a record time as a UTC ISO-8601 string with millisecond precision.
+
+        Args:
+            created: Record creation time in seconds since the epoch
+
+        Returns:
+            Timestamp such as 2024-01-01T12:00:00.123Z
+        """
+        second = int(created)
+        cached_second, prefix = self._timestamp_cache
+        if second != cached_second:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(second))
+            self._timestamp_cache = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1000):03d}Z"
+
     def validate_field(self, field_name: str, field_value: Any) -> Tuple[bool, str]:
         """
         Validate a log field value against defined rules.
@@ -156,8 +282,7 @@ def get_logger(name: str, config_override: Optional[Dict[str, Any]] = None) -> l
         # Load environment configuration
         config = LogConfig()
         if config_override:
-            for key, value in config_override.items():
-                setattr(config, key, value)
+            config = dataclasses.replace(config, **config_override)
 
         # Validate configuration
         if not config.validate():
@@ -203,6 +328,33 @@ def get_logger(name: str, config_override: Optional[Dict[str, Any]] = None) -> l
         basic_logger.error(f"Error configuring logger: {str(e)}")
         return basic_logger
 
+def is_valid_trace_id(trace_id: Optional[str]) -> bool:
+    """
+    Check whether a value is a well-formed trace ID.
+
+    Args:
+        trace_id: Candidate trace ID
+
+    Returns:
+        True if the value is a dashed or compact hex UUID
+    """
+    return bool(trace_id) and _TRACE_ID_RE.match(trace_id) is not None
+
+def is_safe_trace_id(trace_id: Optional[str]) -> bool:
+    """
+    Check whether a client-supplied trace ID can be propagated unchanged.
+
+    Unlike is_valid_trace_id this accepts any upstream ID format, as long as it
+    is bounded in length and limited to a charset safe for headers and logs.
+
+    Args:
+        trace_id: Candidate trace ID, typically an inbound X-Trace-ID header
+
+    Returns:
+        True if the value may be kept as the request's trace ID
+    """
+    return bool(trace_id) and _INBOUND_TRACE_ID_RE.match(trace_id) is not None
+
 def set_trace_id(trace_id: str) -> None:
     """
     Set the trace ID for the current execution context.
@@ -210,13 +362,12 @@ def set_trace_id(trace_id: str) -> None:
     Args:
         trace_id: Trace ID to set
     """
-    try:
-        # Validate trace ID format
-        uuid.UUID(trace_id)
+    if is_valid_trace_id(trace_id):
         TRACE_ID_CTX_VAR.set(trace_id)
-    except ValueError as e:
-        logger = get_logger('trace_id_validator')
-        logger.warning(f"Invalid trace ID format: {str(e)}")
+    else:
+        logging.getLogger('trace_id_validator').warning(
+            "Invalid trace ID format: %r", trace_id
+        )
         TRACE_ID_CTX_VAR.set('')
 
 def get_trace_id() -> str:
@@ -11,8 +11,9 @@ This module provides comprehensive metrics collection capabilities including:
 Version: 1.0.0
 """
 
+import os
 import time
-from typing import Any, Dict, List, Callable, Optional
+from typing import Any, Dict, List, Callable, Optional, Tuple, Type
 from functools import wraps
 import psutil  # version: 5.9.5
 from prometheus_client import (  # version: 0.17.1
@@ -21,7 +22,9 @@ from prometheus_client import (  # version: 0.17.1
     Gauge,
     Histogram,
     REGISTRY,
-    generate_latest
+    CollectorRegistry,
+    generate_latest,
+    multiprocess
 )
 
 from ..config.metrics import MetricsConfig
@@ -80,19 +83,51 @@ VALIDATION_LATENCY = Histogram(
     buckets=[0.05, 0.1, 0.25, 0.5, 1.0]
 )
 
+# Bound label children for hot-path metrics, keyed by (metric, label values)
+_LABEL_CACHE: Dict[Tuple[Any, Tuple[str, ...]], Any] = {}
+
+def _labelled(metric: Any, *label_values: str) -> Any:
+    """Return the metric child for the given label values, binding it once."""
+    key = (metric, label_values)
+    child = _LABEL_CACHE.get(key)
+    if child is None:
+        child = _LABEL_CACHE[key] = metric.labels(*label_values)
+    return child
+
+def get_multiprocess_registry() -> Optional[CollectorRegistry]:
+    """
+    Build an aggregating registry when running under a multi-worker server.
+
+    Returns:
+        Registry collecting from PROMETHEUS_MULTIPROC_DIR, or None in single-process mode
+    """
+    multiproc_dir = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if not multiproc_dir:
+        return None
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=multiproc_dir)
+    return registry
+
 class MetricsManager:
     """Enhanced metrics manager with comprehensive monitoring capabilities."""
 
-    def __init__(self, config: MetricsConfig):
+    # Only one metrics HTTP server may run per process
+    _server_started: bool = False
+
+    def __init__(self, config: MetricsConfig, registry: CollectorRegistry = REGISTRY):
         """
         Initialize metrics manager with configuration and health monitoring.
 
         Args:
             config: Metrics configuration instance
+            registry: Collector registry owned by this manager; defaults to the global registry
         """
         self._config = config
+        self._registry = registry
         self._initialized = False
-        self._collectors = {}
+        # Metrics created through this manager, indexed by name for O(1) lookup
+        self._collectors: Dict[str, Any] = {}
         self._health_status = {
             'status': 'starting',
             'last_check': time.time(),
@@ -114,12 +149,27 @@ class MetricsManager:
             logger.info("Metrics collection disabled by configuration")
             return
 
+        if MetricsManager._server_started:
+            logger.debug("Metrics server already running; skipping start")
+            self._initialized = True
+            return
+
         try:
+            # Serve aggregated worker metrics when running multi-process
+            server_kwargs = {}
+            registry = get_multiprocess_registry()
+            if registry is None and self._registry is not REGISTRY:
+                registry = self._registry
+            if registry is not None:
+                server_kwargs['registry'] = registry
+
             # Start Prometheus HTTP server
             start_http_server(
                 port=self._config.port,
-                addr='0.0.0.0'
+                addr='0.0.0.0',
+                **server_kwargs
             )
+            MetricsManager._server_started = True
             
             # Initialize system metrics collection
             self._init_system_metrics()
@@ -151,7 +201,7 @@ class MetricsManager:
             metrics_data = {}
             
             # Collect current metrics state
-            for collector in REGISTRY.collect():
+            for collector in self._registry.collect():
                 for metric in collector.samples:
                     name = metric.name
                     labels = metric.labels
@@ -171,6 +221,44 @@ class MetricsManager:
             logger.error(f"Metrics aggregation failed: {str(e)}")
             return {}
 
+    def register_metric(
+        self,
+        metric_cls: Type[Any],
+        name: str,
+        documentation: str,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Create a metric in this manager's registry and index it by name.
+
+        Args:
+            metric_cls: Prometheus metric class (Counter, Gauge, Histogram, ...)
+            name: Metric name
+            documentation: Metric help text
+            **kwargs: Extra metric arguments such as labelnames or buckets
+
+        Returns:
+            The registered metric
+        """
+        metric = metric_cls(name, documentation, registry=self._registry, **kwargs)
+        self._collectors[name] = metric
+        return metric
+
+    def get_metric(self, name: str) -> Optional[Any]:
+        """
+        Look up a metric by name without walking the registry.
+
+        Args:
+            name: Metric or sample name
+
+        Returns:
+            The matching collector, or None if not registered
+        """
+        metric = self._collectors.get(name)
+        if metric is None:
+            metric = get_metric(name, self._registry)
+        return metric
+
     def _init_system_metrics(self) -> None:
         """Initialize system-level metrics collection."""
         try:
@@ -195,11 +283,38 @@ class MetricsManager:
             if self._initialized:
                 # Unregister custom collectors
                 for collector in self._collectors.values():
-                    REGISTRY.unregister(collector)
+                    self._registry.unregister(collector)
+                self._collectors.clear()
                 logger.info("Metrics collectors cleaned up successfully")
         except Exception as e:
             logger.error(f"Metrics cleanup failed: {str(e)}")
 
+def get_metric(name: str, registry: CollectorRegistry = REGISTRY) -> Optional[Any]:
+    """
+    Look up the collector that exposes a metric or sample name.
+
+    Args:
+        name: Metric or sample name, e.g. 'translation_requests_total'
+        registry: Registry to search
+
+    Returns:
+        The matching collector, or None if not registered
+    """
+    # The registry keeps its own name index; read it instead of calling collect()
+    return registry._names_to_collectors.get(name)
+
+def get_metrics(registry: CollectorRegistry = REGISTRY) -> str:
+    """
+    Render every metric in a registry in the Prometheus text exposition format.
+
+    Args:
+        registry: Registry to render
+
+    Returns:
+        Exposition text as served on the metrics endpoint
+    """
+    return generate_latest(registry).decode('utf-8')
+
 def track_translation(func: Callable) -> Callable:
     """
     Decorator to track comprehensive translation metrics.
@@ -218,7 +333,7 @@ def track_translation(func: Callable) -> Callable:
         
         try:
             # Track pre-translation metrics
-            MEMORY_USAGE.labels(type='pre_translation').set(
+            _labelled(MEMORY_USAGE, 'pre_translation').set(
                 psutil.Process().memory_info().rss
             )
             
@@ -226,28 +341,17 @@ def track_translation(func: Callable) -> Callable:
             result = func(*args, **kwargs)
             
             # Record successful translation
-            TRANSLATION_COUNTER.labels(
-                source_format=source_format,
-                target_format=target_format,
-                status='success'
-            ).inc()
+            _labelled(TRANSLATION_COUNTER, source_format, target_format, 'success').inc()
             
             # Record latency
             duration = time.time() - start_time
-            TRANSLATION_LATENCY.labels(
-                source_format=source_format,
-                target_format=target_format
-            ).observe(duration)
+            _labelled(TRANSLATION_LATENCY, source_format, target_format).observe(duration)
             
             return result
             
         except Exception as e:
             # Record failed translation
-            ERROR_COUNTER.labels(
-                source_format=source_format,
-                target_format=target_format,
-                error_type=type(e).__name__
-            ).inc()
+            _labelled(ERROR_COUNTER, source_format, target_format, type(e).__name__).inc()
             
             logger.error(
                 f"Translation error: {str(e)}",
@@ -268,6 +372,9 @@ def reset_metrics() -> bool:
         bool: Success status of reset operation
     """
     try:
+        # Drop bound children so they are re-bound after a reset
+        _LABEL_CACHE.clear()
+
         # Reset core metrics
         for collector in REGISTRY.collect():
             if hasattr(collector, 'clear'):